@@ -5,9 +5,12 @@
 """
 
 import logging
-from datetime import datetime
-from typing import List, Dict, Tuple
-import statistics
+import re
+import warnings
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Union
+import numpy as np
 from database import DatabaseManager
 
 logging.basicConfig(
@@ -16,35 +19,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+UTC = timezone.utc
+
 
 class TimeWindowAnalyzer:
     """时间窗口分析器"""
     
+    # 服务端游标每次读取的行数,也是向量化计算时间差的批大小
+    BATCH_SIZE = 10000
+    
     def __init__(self):
         """初始化分析器"""
         self.db = DatabaseManager()
         self.time_diffs = []  # 存储所有时间差(天数)
         
+    # CVE披露时间: "2020-12-11T19:15Z" / "2020-12-11T19:15:30Z" / "2020-12-11T19:15:30.123Z"
+    _CVE_TIME_RE = re.compile(
+        r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?Z$'
+    )
+    
     def parse_cve_time(self, time_str: str) -> datetime:
         """
         解析CVE披露时间
         格式: "2020-12-11T19:15Z"
         """
-        from datetime import timezone
-        
-        formats = [
-            '%Y-%m-%dT%H:%MZ',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(time_str, fmt)
-                # 添加UTC时区信息
-                return dt.replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
+        m = self._CVE_TIME_RE.match(time_str)
+        if m:
+            year, month, day, hour, minute, second, fraction = m.groups()
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour), int(minute), int(second or 0),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                tzinfo=UTC
+            )
         
         # 尝试ISO格式
         try:
@@ -53,47 +60,42 @@ class TimeWindowAnalyzer:
             logger.error(f"无法解析CVE时间: {time_str}, 错误: {e}")
             raise
     
-    def parse_commit_time(self, time_str: str) -> datetime:
+    def parse_commit_time(self, time_str: Union[str, datetime]) -> datetime:
         """
         解析Commit时间
-        格式: "2024-05-26 21:01:08+00"
+        格式: "2024-05-26 21:01:08+00",timestamptz列由psycopg2直接返回datetime时原样使用
         """
-        from datetime import timezone
-        
+        if isinstance(time_str, datetime):
+            return time_str if time_str.tzinfo else time_str.replace(tzinfo=UTC)
         try:
-            # 处理带时区的格式
-            if '+' in time_str:
-                # 格式: "2024-05-26 21:01:08+00"
-                if time_str.endswith('+00'):
-                    time_str = time_str[:-3] + '+00:00'
-                return datetime.fromisoformat(time_str)
-            elif time_str.endswith('00'):
-                # 可能是 "2024-05-26 21:01:08+00" 格式
-                time_str = time_str[:-2] + '+00:00'
-                return datetime.fromisoformat(time_str)
-            else:
-                # 格式: "2024-05-26 21:01:08" (无时区，假设UTC)
-                dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                return dt.replace(tzinfo=timezone.utc)
+            # fromisoformat不认识"+00"这种只有小时的时区写法
+            if time_str.endswith('+00'):
+                time_str += ':00'
+            dt = datetime.fromisoformat(time_str)
+            # 无时区信息时假设UTC
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=UTC)
+            return dt
         except Exception as e:
             logger.error(f"无法解析Commit时间: {time_str}, 错误: {e}")
             raise
     
-    def get_correct_fixes(self, min_score: int = 65) -> List[Dict]:
+    def get_correct_fixes(self, min_score: int = 65) -> Iterator[Dict]:
         """
-        获取正确的CVE-Commit修复对
+        获取正确的CVE-Commit修复对,通过服务端游标分批读取
+        
+        时间在Python端按批解析: 数据库里的披露时间是文本,个别非法值(如"2020-13-45")
+        若在SQL中强制转换会让整个查询失败,在Python端解析时只需跳过该记录
         
         Args:
             min_score: 最低分数阈值，默认65
             
         Returns:
-            正确修复对列表
+            正确修复对迭代器，每条记录包含cve_id、score、published_date和committer_date
         """
         query = """
             SELECT 
                 f.cve_id,
-                f.hash,
-                f.repo_url,
                 f.score,
                 c.published_date,
                 cm.committer_date
@@ -107,21 +109,22 @@ class TimeWindowAnalyzer:
         """
         
         try:
-            self.db.cursor.execute(query, (min_score,))
-            results = self.db.cursor.fetchall()
-            logger.info(f"找到 {len(results)} 个正确的CVE-Commit修复对 (score >= {min_score})")
-            return results
+            count = 0
+            for row in self.db.iter_query('correct_fixes', query, (min_score,), itersize=self.BATCH_SIZE):
+                count += 1
+                yield row
+            logger.info(f"找到 {count} 个正确的CVE-Commit修复对 (score >= {min_score})")
         except Exception as e:
             logger.error(f"查询失败: {e}")
             raise
     
-    def calculate_time_diff(self, cve_time: str, commit_time: str) -> float:
+    def calculate_time_diff(self, cve_time: str, commit_time: Union[str, datetime]) -> float:
         """
         计算CVE披露时间和Commit时间的差值
         
         Args:
             cve_time: CVE披露时间字符串
-            commit_time: Commit提交时间字符串
+            commit_time: Commit提交时间(字符串或datetime)
             
         Returns:
             时间差(天数)，正数表示Commit在CVE之后，负数表示Commit在CVE之前
@@ -134,6 +137,64 @@ class TimeWindowAnalyzer:
         
         return diff
     
+    def _to_datetime64(
+        self,
+        time_strs: List[str],
+        parser: Callable[[str], datetime]
+    ) -> np.ndarray:
+        """
+        批量将时间字符串转换为UTC的datetime64数组
+        
+        先去掉UTC时区后缀整列交给numpy解析；若有numpy无法处理的格式
+        (如非UTC时区或非法日期)，再逐个回退到parser，解析失败的位置为NaT
+        
+        Args:
+            time_strs: 时间字符串列表
+            parser: 单个时间字符串的解析函数
+            
+        Returns:
+            datetime64[us]数组
+        """
+        arr = np.array(time_strs, dtype=np.str_)
+        for suffix in ('Z', '+00:00', '+00'):
+            arr = np.char.replace(arr, suffix, '')
+        
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                return arr.astype('datetime64[us]')
+        except (ValueError, Warning):
+            pass
+        
+        result = np.empty(len(time_strs), dtype='datetime64[us]')
+        for idx, time_str in enumerate(time_strs):
+            try:
+                dt = parser(time_str).astimezone(UTC).replace(tzinfo=None)
+                result[idx] = np.datetime64(dt, 'us')
+            except Exception:
+                result[idx] = np.datetime64('NaT')
+        return result
+    
+    def _batch_time_diffs(self, fixes: List[Dict]) -> np.ndarray:
+        """
+        计算一批修复对的时间差
+        
+        Args:
+            fixes: get_correct_fixes返回的一批记录
+            
+        Returns:
+            时间差(天数)数组，无法解析的记录为NaN
+        """
+        cve_times = self._to_datetime64(
+            [fix['published_date'] for fix in fixes],
+            self.parse_cve_time
+        )
+        commit_times = self._to_datetime64(
+            [str(fix['committer_date']) for fix in fixes],
+            self.parse_commit_time
+        )
+        return (commit_times - cve_times) / np.timedelta64(1, 'D')
+    
     def analyze(self, min_score: int = 65):
         """
         分析时间窗口
@@ -149,39 +210,36 @@ class TimeWindowAnalyzer:
             # 连接数据库
             self.db.connect()
             
-            # 获取正确的修复对
+            # 按游标批次整批转换时间并计算时间差,无法解析的记录(NaT)跳过
+            logger.info("\n开始计算时间差...")
             fixes = self.get_correct_fixes(min_score)
+            batches = []
+            sample_count = 0
+            while True:
+                batch = list(islice(fixes, self.BATCH_SIZE))
+                if not batch:
+                    break
+                batch_diffs = self._batch_time_diffs(batch)
+                valid = ~np.isnan(batch_diffs)
+                for idx in np.flatnonzero(~valid):
+                    logger.warning(f"处理记录失败: {batch[idx]['cve_id']}, 无法解析时间")
+                
+                # 显示前5个样本
+                for idx in np.flatnonzero(valid)[:max(5 - sample_count, 0)]:
+                    sample_count += 1
+                    fix = batch[idx]
+                    logger.info(f"  样本 {sample_count}: CVE={fix['cve_id']}, "
+                              f"时间差={batch_diffs[idx]:.1f}天, score={fix['score']}")
+                batches.append(batch_diffs[valid])
             
-            if not fixes:
+            diffs = np.concatenate(batches) if batches else np.empty(0, dtype=np.float64)
+            if not diffs.size:
                 logger.warning("没有找到符合条件的修复对")
                 return
             
-            # 计算时间差
-            logger.info("\n开始计算时间差...")
-            self.time_diffs = []
-            commit_before_cve = 0  # Commit在CVE之前
-            commit_after_cve = 0   # Commit在CVE之后
-            
-            for idx, fix in enumerate(fixes, 1):
-                try:
-                    diff = self.calculate_time_diff(
-                        fix['published_date'],
-                        str(fix['committer_date'])
-                    )
-                    self.time_diffs.append(diff)
-                    
-                    if diff < 0:
-                        commit_before_cve += 1
-                    else:
-                        commit_after_cve += 1
-                    
-                    if idx <= 5:  # 显示前5个样本
-                        logger.info(f"  样本 {idx}: CVE={fix['cve_id']}, "
-                                  f"时间差={diff:.1f}天, score={fix['score']}")
-                    
-                except Exception as e:
-                    logger.warning(f"处理记录失败: {fix['cve_id']}, 错误: {e}")
-                    continue
+            self.time_diffs = diffs.tolist()
+            commit_before_cve = int((diffs < 0).sum())  # Commit在CVE之前
+            commit_after_cve = int((diffs >= 0).sum())  # Commit在CVE之后
             
             # 统计分析
             self._print_statistics(commit_before_cve, commit_after_cve)
@@ -202,47 +260,47 @@ class TimeWindowAnalyzer:
         logger.info("统计结果")
         logger.info("="*60)
         
+        # 时间差及样本数只计算一次
+        abs_diffs = np.abs(np.asarray(self.time_diffs, dtype=np.float64))
+        n = abs_diffs.size
+        
         # 基本统计
-        logger.info(f"\n总样本数: {len(self.time_diffs)}")
-        logger.info(f"Commit在CVE之前: {commit_before_cve} ({commit_before_cve/len(self.time_diffs)*100:.1f}%)")
-        logger.info(f"Commit在CVE之后: {commit_after_cve} ({commit_after_cve/len(self.time_diffs)*100:.1f}%)")
+        logger.info(f"\n总样本数: {n}")
+        logger.info(f"Commit在CVE之前: {commit_before_cve} ({commit_before_cve/n*100:.1f}%)")
+        logger.info(f"Commit在CVE之后: {commit_after_cve} ({commit_after_cve/n*100:.1f}%)")
+        
+        # 百分位数和中位数只需几个位置上的值，用一次np.partition代替全量排序
+        percentiles = [50, 75, 90, 95, 99]
+        ks = [min(n * p // 100, n - 1) for p in percentiles]
+        mid = [(n - 1) // 2, n // 2]
+        partitioned = np.partition(abs_diffs, ks + mid)
+        quantiles = partitioned[ks]
         
         # 时间差统计(天数)
-        abs_diffs = [abs(d) for d in self.time_diffs]
+        avg_days = abs_diffs.mean()
+        median_days = (partitioned[mid[0]] + partitioned[mid[1]]) / 2
         
         logger.info(f"\n时间差统计 (天数):")
-        logger.info(f"  平均值: {statistics.mean(abs_diffs):.1f} 天")
-        logger.info(f"  中位数: {statistics.median(abs_diffs):.1f} 天")
-        logger.info(f"  最小值: {min(abs_diffs):.1f} 天")
-        logger.info(f"  最大值: {max(abs_diffs):.1f} 天")
+        logger.info(f"  平均值: {avg_days:.1f} 天")
+        logger.info(f"  中位数: {median_days:.1f} 天")
+        logger.info(f"  最小值: {abs_diffs.min():.1f} 天")
+        logger.info(f"  最大值: {abs_diffs.max():.1f} 天")
         
-        if len(abs_diffs) > 1:
-            logger.info(f"  标准差: {statistics.stdev(abs_diffs):.1f} 天")
+        if n > 1:
+            logger.info(f"  标准差: {abs_diffs.std(ddof=1):.1f} 天")
         
-        # 百分位数
-        sorted_diffs = sorted(abs_diffs)
-        percentiles = [50, 75, 90, 95, 99]
         logger.info(f"\n百分位数:")
-        for p in percentiles:
-            idx = int(len(sorted_diffs) * p / 100)
-            if idx >= len(sorted_diffs):
-                idx = len(sorted_diffs) - 1
-            logger.info(f"  {p}%: {sorted_diffs[idx]:.1f} 天")
+        for p, value in zip(percentiles, quantiles):
+            logger.info(f"  {p}%: {value:.1f} 天")
         
         # 分布统计
-        ranges = [
-            (0, 7, "1周内"),
-            (7, 30, "1周-1个月"),
-            (30, 90, "1-3个月"),
-            (90, 180, "3-6个月"),
-            (180, 365, "6个月-1年"),
-            (365, float('inf'), "1年以上")
-        ]
+        bins = [0, 7, 30, 90, 180, 365, np.inf]
+        labels = ["1周内", "1周-1个月", "1-3个月", "3-6个月", "6个月-1年", "1年以上"]
+        counts, _ = np.histogram(abs_diffs, bins=bins)
+        percents = counts / n * 100
         
         logger.info(f"\n时间差分布:")
-        for min_days, max_days, label in ranges:
-            count = sum(1 for d in abs_diffs if min_days <= d < max_days)
-            percent = count / len(abs_diffs) * 100
+        for label, count, percent in zip(labels, counts, percents):
             logger.info(f"  {label:15s}: {count:4d} ({percent:5.1f}%)")
         
         # 推荐时间窗口
@@ -250,11 +308,7 @@ class TimeWindowAnalyzer:
         logger.info("推荐时间窗口")
         logger.info("="*60)
         
-        avg_days = statistics.mean(abs_diffs)
-        median_days = statistics.median(abs_diffs)
-        p75_days = sorted_diffs[int(len(sorted_diffs) * 0.75)]
-        p90_days = sorted_diffs[int(len(sorted_diffs) * 0.90)]
-        p95_days = sorted_diffs[int(len(sorted_diffs) * 0.95)]
+        p75_days, p90_days, p95_days = quantiles[1:4]
         
         logger.info(f"\n基于平均值: ±{avg_days:.0f} 天 (约 {avg_days/30:.1f} 个月)")
         logger.info(f"基于中位数: ±{median_days:.0f} 天 (约 {median_days/30:.1f} 个月)")
@@ -275,15 +329,16 @@ class TimeWindowAnalyzer:
             logger.warning("没有数据可导出")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write("CVE-Commit时间差分析结果\n")
             f.write("="*60 + "\n\n")
             
-            # 写入所有时间差
+            # 写入所有时间差(由numpy批量格式化)
             f.write("详细数据:\n")
             f.write("索引,时间差(天)\n")
-            for idx, diff in enumerate(self.time_diffs, 1):
-                f.write(f"{idx},{diff:.2f}\n")
+            diffs = np.asarray(self.time_diffs, dtype=np.float64)
+            rows = np.column_stack((np.arange(1, len(diffs) + 1), diffs))
+            np.savetxt(f, rows, fmt='%d,%.2f')
         
         logger.info(f"详细结果已导出到: {filename}")
 
@@ -5,7 +5,8 @@ Commit匹配与分析模块
 
 import re
 import logging
-from typing import List, Dict, Set
+from itertools import islice
+from typing import List, Dict, Set, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 @dataclass
 class CommitMatchResult:
     """Commit匹配结果数据类"""
+    # 使用__slots__省去每个实例的__dict__(字段没有默认值,可直接与dataclass配合)
+    __slots__ = ('sha', 'message', 'author', 'date', 'score', 'matched_patterns', 'matched_cve')
+    
     sha: str
     message: str
     author: str
@@ -26,11 +30,8 @@ class CommitMatchResult:
 class CommitMatcher:
     """Commit匹配器类,用于分析commit是否可能修复某个CVE"""
     
-    # CVE相关的关键词模式
-    CVE_PATTERNS = [
-        r'CVE-\d{4}-\d{4,7}',  # CVE编号
-        r'cve-\d{4}-\d{4,7}',  # 小写CVE编号
-    ]
+    # CVE编号模式(忽略大小写,同时匹配大写和小写写法)
+    CVE_PATTERN = re.compile(r'CVE-\d{4}-\d{4,7}', re.IGNORECASE)
     
     # 修复相关的关键词
     FIX_KEYWORDS = [
@@ -70,9 +71,13 @@ class CommitMatcher:
         'merge',
     ]
     
-    def __init__(self):
-        """初始化Commit匹配器"""
-        self.cve_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.CVE_PATTERNS]
+    # 预先转为小写(并去重)的关键词表,避免每次评分时重复调用lower()
+    _FIX_KEYWORDS_LOWER = tuple(dict.fromkeys(keyword.lower() for keyword in FIX_KEYWORDS))
+    _EXCLUDE_KEYWORDS_LOWER = tuple(dict.fromkeys(keyword.lower() for keyword in EXCLUDE_KEYWORDS))
+    
+    # 分数达到上限所需的关键词个数,找到这么多之后无需继续查找
+    _FIX_KEYWORD_LIMIT = 5       # 每个+10分,最多+50分
+    _EXCLUDE_KEYWORD_LIMIT = 6   # 每个-5分,最多-30分
     
     def extract_cve_ids(self, text: str) -> Set[str]:
         """
@@ -84,14 +89,30 @@ class CommitMatcher:
         Returns:
             提取到的CVE编号集合
         """
-        cve_ids = set()
+        # 统一转换为大写格式
+        return {m.upper() for m in self.CVE_PATTERN.findall(text)}
+    
+    @staticmethod
+    def _find_keywords(
+        message_lower: str,
+        keywords: Tuple[str, ...],
+        limit: int
+    ) -> List[str]:
+        """
+        找出消息中出现的关键词(子串匹配,保持关键词表顺序)
         
-        for regex in self.cve_regex:
-            matches = regex.findall(text)
-            # 统一转换为大写格式
-            cve_ids.update([m.upper() for m in matches])
+        这里直接用str的in做子串查找:CPython的re没有Aho-Corasick优化,
+        把关键词拼成一个正则反而比逐个in慢数倍
         
-        return cve_ids
+        Args:
+            message_lower: 已转为小写的commit消息
+            keywords: 已转为小写的关键词
+            limit: 最多返回的关键词个数,找够后提前结束
+            
+        Returns:
+            出现过的关键词列表
+        """
+        return list(islice((keyword for keyword in keywords if keyword in message_lower), limit))
     
     def calculate_match_score(
         self,
@@ -106,40 +127,40 @@ class CommitMatcher:
             target_cve_id: 目标CVE编号
             
         Returns:
-            (score, matched_patterns)元组
+            (score, matched_patterns, cve_ids)元组,cve_ids为消息中提到的CVE编号集合
         """
         score = 0
         matched_patterns = []
         
         message_lower = commit_message.lower()
+        target_cve_upper = target_cve_id.upper()
         
         # 1. 检查是否直接提到目标CVE (最高优先级)
-        cve_ids = self.extract_cve_ids(commit_message)
-        if target_cve_id.upper() in cve_ids:
+        # 绝大多数commit不含CVE编号,先用一次子串查找排除,省去正则扫描
+        cve_ids = self.extract_cve_ids(commit_message) if 'cve-' in message_lower else set()
+        if target_cve_upper in cve_ids:
             score += 100
             matched_patterns.append(f"直接提到CVE: {target_cve_id}")
-            logger.debug(f"Commit直接提到目标CVE: {target_cve_id}")
+            logger.debug("Commit直接提到目标CVE: %s", target_cve_id)
         
         # 2. 检查修复相关关键词
-        fix_keyword_count = 0
-        for keyword in self.FIX_KEYWORDS:
-            if keyword.lower() in message_lower:
-                fix_keyword_count += 1
-                matched_patterns.append(f"修复关键词: {keyword}")
+        fix_keywords = self._find_keywords(
+            message_lower, self._FIX_KEYWORDS_LOWER, self._FIX_KEYWORD_LIMIT
+        )
+        matched_patterns.extend(f"修复关键词: {keyword}" for keyword in fix_keywords)
         
         # 根据关键词数量增加分数
-        if fix_keyword_count > 0:
-            score += min(fix_keyword_count * 10, 50)  # 最多加50分
+        if fix_keywords:
+            score += min(len(fix_keywords) * 10, 50)  # 最多加50分
         
         # 3. 检查排除关键词(减分)
-        exclude_keyword_count = 0
-        for keyword in self.EXCLUDE_KEYWORDS:
-            if keyword.lower() in message_lower:
-                exclude_keyword_count += 1
-                matched_patterns.append(f"排除关键词: {keyword}")
+        exclude_keywords = self._find_keywords(
+            message_lower, self._EXCLUDE_KEYWORDS_LOWER, self._EXCLUDE_KEYWORD_LIMIT
+        )
+        matched_patterns.extend(f"排除关键词: {keyword}" for keyword in exclude_keywords)
         
-        if exclude_keyword_count > 0:
-            score -= min(exclude_keyword_count * 5, 30)  # 最多减30分
+        if exclude_keywords:
+            score -= min(len(exclude_keywords) * 5, 30)  # 最多减30分
         
         # 4. 检查commit消息长度(太短可能不够详细)
         if len(commit_message) < 20:
@@ -147,14 +168,14 @@ class CommitMatcher:
             matched_patterns.append("消息过短")
         
         # 5. 检查是否提到其他CVE(可能是批量修复)
-        other_cves = cve_ids - {target_cve_id.upper()}
+        other_cves = cve_ids - {target_cve_upper}
         if other_cves:
             score += 20
             matched_patterns.append(f"提到其他CVE: {', '.join(other_cves)}")
         
-        logger.debug(f"匹配分数: {score}, 匹配模式: {matched_patterns}")
+        logger.debug("匹配分数: %d, 匹配模式: %s", score, matched_patterns)
         
-        return (score, matched_patterns)
+        return (score, matched_patterns, cve_ids)
     
     def analyze_commit(
         self,
@@ -171,31 +192,51 @@ class CommitMatcher:
         Returns:
             CommitMatchResult对象
         """
-        # 提取commit信息
-        sha = commit.get('sha', '')
         message = commit.get('commit', {}).get('message', '')
-        author_info = commit.get('commit', {}).get('author', {})
-        author = author_info.get('name', 'Unknown')
-        date = author_info.get('date', '')
         
         # 计算匹配分数
-        score, matched_patterns = self.calculate_match_score(message, target_cve_id)
+        score, matched_patterns, cve_ids = self.calculate_match_score(message, target_cve_id)
         
-        # 检查是否直接匹配CVE
-        cve_ids = self.extract_cve_ids(message)
+        # 检查是否直接匹配CVE(复用评分时提取的CVE编号)
         matched_cve = target_cve_id.upper() in cve_ids
         
+        return self._build_result(commit, score, matched_patterns, matched_cve)
+    
+    def _build_result(
+        self,
+        commit: Dict,
+        score: int,
+        matched_patterns: List[str],
+        matched_cve: bool
+    ) -> CommitMatchResult:
+        """
+        根据已算好的分数构造CommitMatchResult
+        
+        Args:
+            commit: GitHub API返回的commit对象
+            score: 匹配分数
+            matched_patterns: 匹配到的模式列表
+            matched_cve: 是否直接提到目标CVE
+            
+        Returns:
+            CommitMatchResult对象
+        """
+        # 提取commit信息
+        sha = commit.get('sha', '')
+        commit_info = commit.get('commit', {})
+        author_info = commit_info.get('author', {})
+        
         result = CommitMatchResult(
             sha=sha,
-            message=message,
-            author=author,
-            date=date,
+            message=commit_info.get('message', ''),
+            author=author_info.get('name', 'Unknown'),
+            date=author_info.get('date', ''),
             score=score,
             matched_patterns=matched_patterns,
             matched_cve=matched_cve
         )
         
-        logger.debug(f"分析commit: {sha[:8]}, 分数: {score}, 匹配CVE: {matched_cve}")
+        logger.debug("分析commit: %.8s, 分数: %d, 匹配CVE: %s", sha, score, matched_cve)
         
         return result
     
@@ -217,11 +258,19 @@ class CommitMatcher:
             CommitMatchResult列表,按分数降序排列
         """
         results = []
+        # 整批commit共用同一个目标CVE,只需转换一次大小写
+        target_cve_upper = target_cve_id.upper()
+        
+        messages = [commit.get('commit', {}).get('message', '') for commit in commits]
+        scored = self._score_messages(messages, target_cve_upper)
         
-        for commit in commits:
-            result = self.analyze_commit(commit, target_cve_id)
-            if result.score >= min_score:
-                results.append(result)
+        for commit, (score, matched_patterns, cve_ids) in zip(commits, scored):
+            # 先按分数过滤,只为保留下来的commit构造结果对象
+            if score < min_score:
+                continue
+            results.append(self._build_result(
+                commit, score, matched_patterns, target_cve_upper in cve_ids
+            ))
         
         # 按分数降序排序
         results.sort(key=lambda x: x.score, reverse=True)
@@ -230,6 +279,32 @@ class CommitMatcher:
         
         return results
     
+    def _score_messages(self, messages: List[str], target_cve_id: str) -> List[tuple]:
+        """
+        批量计算commit消息的匹配分数
+        相同的消息(如merge/revert模板消息)只计算一次
+        
+        Args:
+            messages: commit消息列表
+            target_cve_id: 目标CVE编号
+            
+        Returns:
+            与messages一一对应的calculate_match_score结果列表
+        """
+        unique_messages = list(dict.fromkeys(messages))
+        scored = [self.calculate_match_score(message, target_cve_id) for message in unique_messages]
+        
+        if len(unique_messages) == len(messages):
+            return scored
+        
+        # 重复消息共用同一份结果,matched_patterns复制一份,避免多个结果对象共享同一个列表
+        scored_by_message = dict(zip(unique_messages, scored))
+        results = []
+        for message in messages:
+            score, matched_patterns, cve_ids = scored_by_message[message]
+            results.append((score, list(matched_patterns), cve_ids))
+        return results
+    
     def get_top_candidates(
         self,
         commits: List[Dict],
@@ -282,6 +357,6 @@ if __name__ == "__main__":
     print("\n测试分数计算:")
     target_cve = "CVE-2020-1234"
     for msg in test_messages:
-        score, patterns = matcher.calculate_match_score(msg, target_cve)
+        score, patterns, _ = matcher.calculate_match_score(msg, target_cve)
         print(f"  '{msg}'")
         print(f"    分数: {score}, 匹配模式: {patterns}")
@@ -21,7 +21,11 @@ GITHUB_CONFIG = {
     'api_token': os.getenv('GITHUB_TOKEN'),  # 请填写你的GitHub Personal Access Token
     'api_base_url': 'https://api.github.com',
     'requests_per_hour': 5000,  # 认证后的限制
-    'timeout': 30  # API请求超时时间(秒)
+    'timeout': 30,  # API请求超时时间(秒)
+    'etag_cache_file': 'etag_cache.json',  # ETag条件请求缓存文件,重复运行时未变化的资源返回304
+    'etag_cache_max_bytes': 32 * 1024 * 1024,  # ETag缓存保存的响应总字节数上限(按最近使用淘汰),0表示不缓存
+    'use_graphql': True,  # 优先用GraphQL一次请求获取仓库存在性和commit历史,失败时退回REST
+    'repo_cache_ttl': None  # 仓库存在性缓存有效期(秒),None表示本次运行内一直有效
 }
 
 # 时间范围配置(相对于CVE披露时间)
@@ -40,5 +44,7 @@ LOG_CONFIG = {
 BATCH_CONFIG = {
     'batch_size': 10,  # 每批处理的CVE数量
     'retry_times': 3,  # API失败重试次数
-    'retry_delay': 5   # 重试延迟(秒)
+    'retry_delay': 5,  # 重试延迟(秒)
+    'max_workers': 4,  # 并发处理CVE的线程数
+    'max_per_second': 1.3  # GitHub请求速率上限(次/秒,约4680次/小时,低于5000次/小时的额度)
 }
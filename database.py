@@ -3,14 +3,87 @@
 负责与PostgreSQL数据库的交互
 """
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
-from typing import List, Dict, Optional
+from psycopg2.pool import ThreadedConnectionPool
+from collections import OrderedDict, defaultdict
+from typing import Any, Iterator, List, Dict, Optional
 import logging
 from config import DB_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# 连接池(按数据库配置区分,首次connect时创建)
+_POOLS: Dict[tuple, ThreadedConnectionPool] = {}
+
+# 热点查询的预编译语句,首次使用时才在当前连接上PREPARE(用不到的表不影响连接)
+PREPARED_STATEMENTS = {
+    'get_known_fixes_for_cves': """
+        SELECT cve_id, hash, repo_url, rel_type, score
+        FROM fixes
+        WHERE cve_id = ANY($1)
+    """,
+    'get_commit_details': """
+        SELECT *
+        FROM commits
+        WHERE hash = $1 AND repo_url = $2
+    """,
+    'check_repo_exists': """
+        SELECT 1
+        FROM repository
+        WHERE repo_url = $1
+        LIMIT 1
+    """,
+}
+
+
+class LRUCache:
+    """简单的LRU缓存,超出容量时淘汰最久未使用的条目"""
+    
+    # 区分"未命中"和"缓存的值就是None"
+    MISSING = object()
+    
+    def __init__(self, maxsize: int = 10000):
+        """
+        Args:
+            maxsize: 最多缓存的条目数
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        """获取缓存值,未命中返回LRUCache.MISSING"""
+        if key not in self._data:
+            return self.MISSING
+        self._data.move_to_end(key)
+        return self._data[key]
+    
+    def put(self, key: Any, value: Any):
+        """写入缓存值"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        """清空缓存"""
+        self._data.clear()
+
+
+def _get_pool(config: Dict) -> ThreadedConnectionPool:
+    """
+    获取(必要时创建)指定配置对应的连接池
+    
+    Args:
+        config: 数据库配置字典
+        
+    Returns:
+        连接池对象
+    """
+    key = tuple(sorted(config.items()))
+    if key not in _POOLS:
+        _POOLS[key] = ThreadedConnectionPool(1, 8, **config)
+    return _POOLS[key]
+
 
 class DatabaseManager:
     """数据库管理类,处理所有数据库操作"""
@@ -26,56 +99,123 @@ class DatabaseManager:
         self.connection = None
         self.cursor = None
         
+        # 查询结果缓存,避免同一个key重复查询数据库
+        self._commit_cache = LRUCache(maxsize=10000)
+        self._repo_exists_cache = LRUCache(maxsize=10000)
+        self._cve_count = None
+        # 当前连接上已PREPARE的语句名,首次执行预编译语句时从pg_prepared_statements读取
+        self._prepared = None
+        
     def connect(self):
-        """建立数据库连接"""
+        """从连接池获取数据库连接"""
         try:
-            self.connection = psycopg2.connect(**self.config)
+            self.connection = _get_pool(self.config).getconn()
             self.cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+            self._prepared = None
             logger.info("数据库连接成功")
         except Exception as e:
             logger.error(f"数据库连接失败: {e}")
             raise
     
     def disconnect(self):
-        """关闭数据库连接"""
+        """归还数据库连接到连接池"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            _get_pool(self.config).putconn(self.connection)
+            self.connection = None
+        self._prepared = None
+        # 断开后清空缓存,避免下次运行读到过期数据
+        self._commit_cache.clear()
+        self._repo_exists_cache.clear()
         logger.info("数据库连接已关闭")
     
-    def get_cve_with_repos(self, limit: int = None, offset: int = 0) -> List[Dict]:
+    def _execute_prepared(self, name: str, params: tuple):
+        """
+        执行预编译语句,首次使用时才在当前连接上PREPARE(连接复用时跳过已预编译的语句)
+        
+        Args:
+            name: PREPARED_STATEMENTS中的语句名
+            params: 语句参数
+        """
+        if self._prepared is None:
+            self.cursor.execute("SELECT name FROM pg_prepared_statements")
+            self._prepared = {row['name'] for row in self.cursor.fetchall()}
+        
+        if name not in self._prepared:
+            self.cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            self._prepared.add(name)
+        
+        placeholders = ', '.join(['%s'] * len(params))
+        self.cursor.execute(f"EXECUTE {name}({placeholders})", params)
+    
+    def iter_query(
+        self,
+        cursor_name: str,
+        query: str,
+        params: tuple = None,
+        itersize: int = 5000
+    ) -> Iterator[Dict]:
+        """
+        通过服务端(命名)游标执行查询,分批流式读取结果,避免一次性载入内存
+        
+        Args:
+            cursor_name: 服务端游标名称
+            query: SQL语句
+            params: 查询参数
+            itersize: 每次从服务端读取的行数
+            
+        Returns:
+            结果行迭代器
+        """
+        cursor = self.connection.cursor(cursor_name, cursor_factory=RealDictCursor)
+        cursor.itersize = itersize
+        try:
+            cursor.execute(query, params)
+            yield from cursor
+        finally:
+            cursor.close()
+    
+    def get_cve_with_repos(self, limit: int = None, offset: int = 0) -> Iterator[Dict]:
         """
-        获取CVE及其关联的GitHub仓库信息
+        获取CVE及其关联的GitHub仓库信息(流式返回)
         
         Args:
             limit: 限制返回的记录数,None表示不限制
             offset: 偏移量,用于分页
             
         Returns:
-            包含CVE和仓库信息的字典列表
+            包含CVE和仓库信息的字典迭代器
         """
+        # 先在cve_project上对(cve, project_url)去重,再与cve表关联,
+        # 避免对整个JOIN结果做DISTINCT(cve_id是cve表主键,结果等价)
         query = """
-            SELECT DISTINCT
+            WITH gh_projects AS (
+                SELECT DISTINCT cve, project_url
+                FROM cve_project
+                WHERE project_url LIKE '%%github.com%%'
+            )
+            SELECT
                 c.cve_id,
                 c.published_date,
-                cp.project_url as repo_url
+                gp.project_url as repo_url
             FROM cve c
-            INNER JOIN cve_project cp ON c.cve_id = cp.cve
-            WHERE cp.project_url LIKE '%github.com%'
-                AND c.published_date IS NOT NULL
+            INNER JOIN gh_projects gp ON gp.cve = c.cve_id
+            WHERE c.published_date IS NOT NULL
                 AND c.published_date != ''
-            ORDER BY c.cve_id
+            ORDER BY c.cve_id, gp.project_url
+            LIMIT %s OFFSET %s
         """
-        
-        if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
+        # LIMIT NULL等价于不限制
+        params = (limit, offset) if limit else (None, 0)
         
         try:
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            logger.info(f"查询到 {len(results)} 条CVE-仓库关联记录")
-            return results
+            count = 0
+            for row in self.iter_query('cve_with_repos', query, params):
+                count += 1
+                yield row
+            logger.info(f"查询到 {count} 条CVE-仓库关联记录")
         except Exception as e:
             logger.error(f"查询CVE和仓库信息失败: {e}")
             raise
@@ -91,17 +231,28 @@ class DatabaseManager:
         Returns:
             已知修复commit列表
         """
-        query = """
-            SELECT hash, repo_url, rel_type, score
-            FROM fixes
-            WHERE cve_id = %s
+        return self.get_known_fixes_for_cves([cve_id]).get(cve_id, [])
+    
+    def get_known_fixes_for_cves(self, cve_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        批量获取多个CVE已知的修复commit(一次查询)
+        
+        Args:
+            cve_ids: CVE编号列表
+            
+        Returns:
+            以CVE编号为key、已知修复commit列表为value的字典,没有修复记录的CVE不在其中
         """
+        if not cve_ids:
+            return {}
         
         try:
-            self.cursor.execute(query, (cve_id,))
-            results = self.cursor.fetchall()
-            logger.debug(f"CVE {cve_id} 有 {len(results)} 个已知修复commit")
-            return results
+            self._execute_prepared('get_known_fixes_for_cves', (list(cve_ids),))
+            fixes = defaultdict(list)
+            for row in self.cursor.fetchall():
+                fixes[row['cve_id']].append(row)
+            logger.debug(f"{len(cve_ids)} 个CVE共有 {sum(map(len, fixes.values()))} 个已知修复commit")
+            return dict(fixes)
         except Exception as e:
             logger.error(f"查询已知修复commit失败: {e}")
             raise
@@ -117,15 +268,15 @@ class DatabaseManager:
         Returns:
             commit详细信息字典,如果不存在返回None
         """
-        query = """
-            SELECT *
-            FROM commits
-            WHERE hash = %s AND repo_url = %s
-        """
+        key = (commit_hash, repo_url)
+        cached = self._commit_cache.get(key)
+        if cached is not LRUCache.MISSING:
+            return cached
         
         try:
-            self.cursor.execute(query, (commit_hash, repo_url))
+            self._execute_prepared('get_commit_details', (commit_hash, repo_url))
             result = self.cursor.fetchone()
+            self._commit_cache.put(key, result)
             return result
         except Exception as e:
             logger.error(f"查询commit详情失败: {e}")
@@ -141,39 +292,48 @@ class DatabaseManager:
         Returns:
             True表示存在,False表示不存在
         """
-        query = """
-            SELECT 1
-            FROM repository
-            WHERE repo_url = %s
-        """
+        cached = self._repo_exists_cache.get(repo_url)
+        if cached is not LRUCache.MISSING:
+            return cached
         
         try:
-            self.cursor.execute(query, (repo_url,))
-            return self.cursor.fetchone() is not None
+            self._execute_prepared('check_repo_exists', (repo_url,))
+            exists = self.cursor.fetchone() is not None
+            self._repo_exists_cache.put(repo_url, exists)
+            return exists
         except Exception as e:
             logger.error(f"检查仓库是否存在失败: {e}")
             raise
     
     def get_cve_count(self) -> int:
         """
-        获取数据库中CVE的总数
+        获取数据库中CVE的总数(结果在本实例内缓存)
         
         Returns:
             CVE总数
         """
+        if self._cve_count is not None:
+            return self._cve_count
+        
+        # 用EXISTS代替JOIN + COUNT(DISTINCT),每个CVE找到一个GitHub项目即可停止
         query = """
-            SELECT COUNT(DISTINCT c.cve_id)
+            SELECT COUNT(*)
             FROM cve c
-            INNER JOIN cve_project cp ON c.cve_id = cp.cve
-            WHERE cp.project_url LIKE '%github.com%'
-                AND c.published_date IS NOT NULL
+            WHERE c.published_date IS NOT NULL
                 AND c.published_date != ''
+                AND EXISTS (
+                    SELECT 1
+                    FROM cve_project cp
+                    WHERE cp.cve = c.cve_id
+                        AND cp.project_url LIKE '%github.com%'
+                )
         """
         
         try:
             self.cursor.execute(query)
             result = self.cursor.fetchone()
             count = result['count'] if result else 0
+            self._cve_count = count
             logger.info(f"数据库中共有 {count} 个有效CVE")
             return count
         except Exception as e:
@@ -194,9 +354,8 @@ if __name__ == "__main__":
         print(f"CVE总数: {total}")
         
         # 测试获取前5条CVE
-        cves = db.get_cve_with_repos(limit=5)
         print(f"\n前5条CVE记录:")
-        for cve in cves:
+        for cve in db.get_cve_with_repos(limit=5):
             print(f"  {cve['cve_id']}: {cve['published_date']} -> {cve['repo_url']}")
         
     finally:
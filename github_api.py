@@ -4,18 +4,87 @@ GitHub API交互模块
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
 import time
 import logging
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional, Tuple
+from urllib.parse import urlencode
 from datetime import datetime
 from config import GITHUB_CONFIG, BATCH_CONFIG
 
+# 优先使用orjson解析响应(比标准库json快数倍),未安装时退回标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# 仓库URL: 可选协议和github.com前缀,取前两段路径作为owner/repo;repo是最后一段时去掉.git后缀
+# 前缀用 (?=(X))\1 写成原子匹配: 出现就必须去掉,不允许回溯后把前缀当成owner
+_REPO_URL_RE = re.compile(
+    r'(?=((?:https?://)?))\1(?=((?:github\.com/)?))\2'
+    r'([^/]*)/(?:([^/]*?)\.git\Z|([^/]*))'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_repo_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    解析(已去除首尾空白的)仓库URL,结果按URL缓存(同一仓库的CVE通常很多)
+    
+    Args:
+        url: 仓库URL
+        
+    Returns:
+        (owner, repo)元组,无法解析返回None
+    """
+    match = _REPO_URL_RE.match(url)
+    if not match:
+        return None
+    _, _, owner, git_repo, repo = match.groups()
+    return (owner, repo if git_repo is None else git_repo)
+
+# 一次查询同时返回仓库是否存在和默认分支在时间范围内的commit历史(每页最多100条)
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp, $until: GitTimestamp, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(since: $since, until: $until, first: 100, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              url
+              message
+              author { name email date }
+              committer { name email date }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 
 class GitHubAPIClient:
     """GitHub API客户端类,处理所有GitHub API调用"""
     
+    # 服务端临时故障,按指数退避重试
+    RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+    # 认证失败/请求无法处理,重试也不会成功
+    NON_RETRYABLE_STATUS = frozenset({401, 422})
+    
     def __init__(self, api_token: str = None):
         """
         初始化GitHub API客户端
@@ -25,12 +94,252 @@ class GitHubAPIClient:
         """
         self.api_token = api_token or GITHUB_CONFIG['api_token']
         self.base_url = GITHUB_CONFIG['api_base_url']
+        # GraphQL需要认证,未配置token时直接使用REST
+        self.use_graphql = bool(GITHUB_CONFIG.get('use_graphql')) and bool(self.api_token)
         self.timeout = GITHUB_CONFIG['timeout']
         self.headers = {
             'Authorization': f'token {self.api_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         
+        # 复用TCP/TLS连接,避免每个请求都重新握手(重试由_make_request自行处理)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # ETag缓存: 请求键 -> (etag, 原始响应字节),命中时发送If-None-Match,304时重新解析缓存的响应
+        # 只保存原始字节(不持有解析后的对象,调用方用完即可释放),按最近使用顺序保存,
+        # 总字节数超过上限时淘汰最久未用的条目,避免内存和缓存文件随运行无限增长
+        self.etag_cache_file = GITHUB_CONFIG.get('etag_cache_file')
+        self.etag_cache_max_bytes = GITHUB_CONFIG.get('etag_cache_max_bytes', 32 * 1024 * 1024)
+        self._etag_cache_bytes = 0
+        self.etag_cache: OrderedDict = self._load_etag_cache()
+        self._etag_lock = threading.Lock()
+        
+        # 速率限制状态: 资源类型(core/graphql) -> {'remaining', 'limit', 'reset'},由每个响应的头部更新
+        self.rate_state: Dict[str, Dict[str, float]] = {}
+        self._last_request_ts: Dict[str, float] = {}
+        # 每秒请求数上限(所有线程合计),在剩余额度充足时也避免突发请求触发二级限流
+        max_per_second = BATCH_CONFIG.get('max_per_second')
+        self.min_request_interval = 1.0 / max_per_second if max_per_second else 0.0
+        
+        # 仓库存在性缓存(含不存在的结果): (owner, repo)小写 -> (是否存在, 记录时间)
+        self._repo_exists_cache: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+        self.repo_cache_ttl = GITHUB_CONFIG.get('repo_cache_ttl')
+        # 每个线程最近一次REST请求的最终状态码(超时/连接异常为None),用于区分404与临时失败
+        self._request_state = threading.local()
+        self._rate_lock = threading.Lock()
+    
+    @property
+    def rate_limit_remaining(self) -> Optional[int]:
+        """REST API剩余请求次数(取自最近一次响应头,尚无响应时为None)"""
+        state = self.rate_state.get('core')
+        return state['remaining'] if state else None
+    
+    def close(self):
+        """保存ETag缓存并关闭HTTP会话,释放连接池"""
+        self._save_etag_cache()
+        self.session.close()
+    
+    def _load_etag_cache(self) -> OrderedDict:
+        """
+        从文件加载ETag缓存(文件按最近使用顺序保存,超过字节上限时只保留最近的条目)
+        
+        Returns:
+            ETag缓存有序字典,文件不存在或损坏时返回空字典
+        """
+        if not self.etag_cache_file or not os.path.exists(self.etag_cache_file):
+            return OrderedDict()
+        try:
+            with open(self.etag_cache_file, 'rb') as f:
+                data = _json_loads(f.read())
+            # 从最近使用的条目往前取,直到达到字节上限
+            items = []
+            for key, (etag, body) in reversed(list(data.items())):
+                content = body.encode('utf-8')
+                if self._etag_cache_bytes + len(content) > self.etag_cache_max_bytes:
+                    break
+                self._etag_cache_bytes += len(content)
+                items.append((key, (etag, content)))
+            items.reverse()
+            logger.info("加载ETag缓存 %d 条(%.1f MB): %s",
+                        len(items), self._etag_cache_bytes / 1048576, self.etag_cache_file)
+            return OrderedDict(items)
+        except Exception as e:
+            logger.warning("加载ETag缓存失败,忽略: %s", e)
+            self._etag_cache_bytes = 0
+            return OrderedDict()
+    
+    def _get_cached_etag(self, cache_key: str) -> Optional[Tuple[str, bytes]]:
+        """
+        读取ETag缓存条目,命中时标记为最近使用
+        
+        Args:
+            cache_key: 缓存键
+            
+        Returns:
+            (etag, 原始响应字节),未缓存返回None
+        """
+        with self._etag_lock:
+            cached = self.etag_cache.get(cache_key)
+            if cached is not None:
+                self.etag_cache.move_to_end(cache_key)
+            return cached
+    
+    def _set_cached_etag(self, cache_key: str, etag: str, content: bytes):
+        """
+        写入ETag缓存条目,总字节数超过上限时淘汰最久未用的条目
+        
+        Args:
+            cache_key: 缓存键
+            etag: 响应的ETag
+            content: 原始响应字节
+        """
+        if len(content) > self.etag_cache_max_bytes:
+            return
+        with self._etag_lock:
+            old = self.etag_cache.pop(cache_key, None)
+            if old is not None:
+                self._etag_cache_bytes -= len(old[1])
+            self.etag_cache[cache_key] = (etag, content)
+            self._etag_cache_bytes += len(content)
+            while self._etag_cache_bytes > self.etag_cache_max_bytes:
+                _, (_, evicted) = self.etag_cache.popitem(last=False)
+                self._etag_cache_bytes -= len(evicted)
+    
+    def _save_etag_cache(self):
+        """将ETag缓存写回文件"""
+        if not self.etag_cache_file:
+            return
+        with self._etag_lock:
+            data = {key: (etag, content.decode('utf-8')) for key, (etag, content) in self.etag_cache.items()}
+        try:
+            with open(self.etag_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            logger.info("ETag缓存已保存 %d 条: %s", len(data), self.etag_cache_file)
+        except Exception as e:
+            logger.error("保存ETag缓存失败: %s", e)
+    
+    @staticmethod
+    def _cache_key(url: str, params: Dict = None) -> str:
+        """
+        生成ETag缓存键(URL + 排序后的查询参数)
+        
+        Args:
+            url: API端点URL
+            params: 查询参数
+            
+        Returns:
+            缓存键字符串
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+    
+    def _throttle(self, resource: str):
+        """
+        按剩余额度均匀分配请求: 两次请求至少间隔 (重置剩余时间 / 剩余次数),
+        且不低于每秒请求数上限对应的间隔
+        
+        多个线程共享同一个时间表,各自预约下一个可用时刻后再休眠
+        
+        Args:
+            resource: 速率限制资源类型
+        """
+        with self._rate_lock:
+            now = time.time()
+            min_interval = self.min_request_interval
+            state = self.rate_state.get(resource)
+            # 尚未收到任何响应时额度未知,只按每秒上限限速
+            if state is not None:
+                min_interval = max(
+                    min_interval, (state['reset'] - now) / max(state['remaining'], 1)
+                )
+            start = max(now, self._last_request_ts.get(resource, 0.0) + min_interval)
+            self._last_request_ts[resource] = start
+        
+        if start > now:
+            time.sleep(start - now)
+    
+    def _update_rate_state(self, response: requests.Response, resource: str):
+        """
+        根据响应头更新速率限制状态,额度即将用尽时等待重置
+        
+        Args:
+            response: HTTP响应
+            resource: 默认资源类型(响应头中有X-RateLimit-Resource时以响应头为准)
+        """
+        headers = response.headers
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        
+        remaining = int(headers['X-RateLimit-Remaining'])
+        limit = int(headers.get('X-RateLimit-Limit', 0))
+        reset_time = int(headers.get('X-RateLimit-Reset', 0))
+        resource = headers.get('X-RateLimit-Resource', resource)
+        with self._rate_lock:
+            self.rate_state[resource] = {'remaining': remaining, 'limit': limit, 'reset': reset_time}
+        
+        if remaining < 10:
+            wait_time = reset_time - time.time() + 10
+            if wait_time > 0:
+                logger.warning("API速率限制即将用尽,等待 %.0f 秒", wait_time)
+                time.sleep(wait_time)
+    
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response, retry_count: int) -> Optional[float]:
+        """
+        判断403/429响应是否为速率限制,并计算重试前的等待时间
+        
+        Args:
+            response: HTTP响应
+            retry_count: 已重试次数
+            
+        Returns:
+            等待秒数(优先Retry-After,其次等到额度重置,否则指数退避),不是速率限制返回None
+        """
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            return float(retry_after)
+        if headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in headers:
+            return max(0.0, int(headers['X-RateLimit-Reset']) - time.time())
+        if response.status_code == 429 or 'rate limit' in response.text.lower():
+            return BATCH_CONFIG['retry_delay'] * 2 ** retry_count
+        return None
+    
+    def _get_cached_repo_exists(self, owner: str, repo: str) -> Optional[bool]:
+        """
+        查询仓库存在性缓存
+        
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            
+        Returns:
+            缓存的存在性,未缓存或已过期返回None
+        """
+        cached = self._repo_exists_cache.get((owner.lower(), repo.lower()))
+        if cached is None:
+            return None
+        exists, cached_at = cached
+        if self.repo_cache_ttl is not None and time.monotonic() - cached_at >= self.repo_cache_ttl:
+            return None
+        return exists
+    
+    def _set_cached_repo_exists(self, owner: str, repo: str, exists: bool):
+        """
+        记录仓库存在性(GitHub仓库名不区分大小写)
+        
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            exists: 是否存在
+        """
+        self._repo_exists_cache[(owner.lower(), repo.lower())] = (exists, time.monotonic())
+    
     def _make_request(self, url: str, params: Dict = None) -> Optional[Dict]:
         """
         发送HTTP请求到GitHub API
@@ -46,51 +355,208 @@ class GitHubAPIClient:
         max_retries = BATCH_CONFIG['retry_times']
         retry_delay = BATCH_CONFIG['retry_delay']
         
+        # 已缓存的资源发送条件请求
+        cache_key = self._cache_key(url, params)
+        cached = self._get_cached_etag(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        self._request_state.last_status = None
+        
         while retry_count < max_retries:
+            wait_time = retry_delay
             try:
-                response = requests.get(
+                self._throttle('core')
+                response = self.session.get(
                     url,
-                    headers=self.headers,
                     params=params,
+                    headers=headers,
                     timeout=self.timeout
                 )
                 
                 # 检查速率限制
-                remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-                if remaining < 10:
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                    wait_time = reset_time - time.time() + 10
-                    if wait_time > 0:
-                        logger.warning(f"API速率限制即将用尽,等待 {wait_time:.0f} 秒")
-                        time.sleep(wait_time)
+                self._update_rate_state(response, 'core')
+                self._request_state.last_status = response.status_code
                 
                 # 处理响应
                 if response.status_code == 200:
-                    return response.json()
+                    data = _json_loads(response.content)
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._set_cached_etag(cache_key, etag, response.content)
+                    return data
+                elif response.status_code == 304 and cached:
+                    logger.debug("资源未变化(304),使用缓存: %s", url)
+                    return _json_loads(cached[1])
                 elif response.status_code == 404:
-                    logger.warning(f"资源不存在(404): {url}")
-                    return None
-                elif response.status_code == 403:
-                    logger.error("API速率限制超出或访问被拒绝")
+                    logger.warning("资源不存在(404): %s", url)
                     return None
+                elif response.status_code in (403, 429):
+                    rate_limit_wait = self._rate_limit_wait(response, retry_count)
+                    if rate_limit_wait is None:
+                        logger.error("API访问被拒绝")
+                        return None
+                    wait_time = rate_limit_wait
+                    logger.warning("API速率限制超出(%d),%.0f 秒后重试", response.status_code, wait_time)
                 elif response.status_code == 409:
-                    logger.warning(f"仓库为空或正在初始化(409): {url}")
+                    logger.warning("仓库为空或正在初始化(409): %s", url)
+                    return None
+                elif response.status_code in self.NON_RETRYABLE_STATUS:
+                    logger.warning("请求失败且不可重试,状态码: %d, URL: %s", response.status_code, url)
                     return None
+                elif response.status_code in self.RETRYABLE_STATUS:
+                    wait_time = retry_delay * 2 ** retry_count
+                    logger.warning("服务端错误,状态码: %d, URL: %s, %.0f 秒后重试",
+                                   response.status_code, url, wait_time)
                 else:
-                    logger.warning(f"请求失败,状态码: {response.status_code}, URL: {url}")
+                    logger.warning("请求失败,状态码: %d, URL: %s", response.status_code, url)
                     
             except requests.exceptions.Timeout:
-                logger.warning(f"请求超时,重试 {retry_count + 1}/{max_retries}")
+                logger.warning("请求超时,重试 %d/%d", retry_count + 1, max_retries)
+                self._request_state.last_status = None
             except requests.exceptions.RequestException as e:
-                logger.error(f"请求异常: {e}")
+                logger.error("请求异常: %s", e)
+                self._request_state.last_status = None
             
             retry_count += 1
             if retry_count < max_retries:
-                time.sleep(retry_delay)
+                time.sleep(wait_time)
         
-        logger.error(f"请求失败,已重试 {max_retries} 次: {url}")
+        logger.error("请求失败,已重试 %d 次: %s", max_retries, url)
         return None
     
+    def _make_graphql_request(self, query: str, variables: Dict) -> Optional[Dict]:
+        """
+        发送GraphQL请求到GitHub API
+        
+        Args:
+            query: GraphQL查询语句
+            variables: 查询变量
+            
+        Returns:
+            完整响应JSON(包含data和errors),失败返回None
+        """
+        url = f"{self.base_url}/graphql"
+        retry_count = 0
+        max_retries = BATCH_CONFIG['retry_times']
+        retry_delay = BATCH_CONFIG['retry_delay']
+        
+        while retry_count < max_retries:
+            wait_time = retry_delay
+            try:
+                self._throttle('graphql')
+                response = self.session.post(
+                    url,
+                    json={'query': query, 'variables': variables},
+                    timeout=self.timeout
+                )
+                self._update_rate_state(response, 'graphql')
+                
+                rate_limit_wait = None
+                if response.status_code in (403, 429):
+                    rate_limit_wait = self._rate_limit_wait(response, retry_count)
+                
+                if response.status_code == 200:
+                    return _json_loads(response.content)
+                elif rate_limit_wait is not None:
+                    wait_time = rate_limit_wait
+                    logger.warning("GraphQL速率限制超出(%d),%.0f 秒后重试", response.status_code, wait_time)
+                elif response.status_code in (401, 403, 404):
+                    # 认证失败或不支持GraphQL,本次运行不再尝试
+                    logger.warning("GraphQL不可用(状态码: %d),改用REST API", response.status_code)
+                    self.use_graphql = False
+                    return None
+                elif response.status_code in self.NON_RETRYABLE_STATUS:
+                    logger.warning("GraphQL请求失败且不可重试,状态码: %d", response.status_code)
+                    return None
+                elif response.status_code in self.RETRYABLE_STATUS:
+                    wait_time = retry_delay * 2 ** retry_count
+                    logger.warning("GraphQL服务端错误,状态码: %d, %.0f 秒后重试",
+                                   response.status_code, wait_time)
+                else:
+                    logger.warning("GraphQL请求失败,状态码: %d", response.status_code)
+                    
+            except requests.exceptions.Timeout:
+                logger.warning("GraphQL请求超时,重试 %d/%d", retry_count + 1, max_retries)
+            except requests.exceptions.RequestException as e:
+                logger.error("GraphQL请求异常: %s", e)
+            
+            retry_count += 1
+            if retry_count < max_retries:
+                time.sleep(wait_time)
+        
+        logger.error("GraphQL请求失败,已重试 %d 次", max_retries)
+        return None
+    
+    def get_commits_graphql(
+        self,
+        owner: str,
+        repo: str,
+        since: str,
+        until: str,
+        max_pages: int = 10
+    ) -> Optional[Tuple[bool, List[Dict]]]:
+        """
+        通过GraphQL一次性获取仓库存在性和时间范围内的commits(处理分页)
+        
+        返回的commit已转换为REST API的结构(sha, html_url, commit.message等),
+        可以与get_all_commits_in_time_range的结果互换使用
+        
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            since: 开始时间(ISO 8601格式)
+            until: 结束时间(ISO 8601格式)
+            max_pages: 最大页数限制
+            
+        Returns:
+            (仓库是否存在, commit列表),GraphQL请求失败返回None(调用方应退回REST)
+        """
+        if self._get_cached_repo_exists(owner, repo) is False:
+            return (False, [])
+        
+        all_commits = []
+        variables = {'owner': owner, 'name': repo, 'since': since, 'until': until, 'cursor': None}
+        
+        for _ in range(max_pages):
+            response = self._make_graphql_request(COMMIT_HISTORY_QUERY, variables)
+            if response is None:
+                return None
+            
+            repository = (response.get('data') or {}).get('repository')
+            if repository is None:
+                errors = response.get('errors') or []
+                if any(error.get('type') == 'NOT_FOUND' for error in errors):
+                    logger.warning("仓库不存在或无法访问: %s/%s", owner, repo)
+                    self._set_cached_repo_exists(owner, repo, False)
+                    return (False, [])
+                logger.warning("GraphQL查询出错: %s", errors)
+                return None
+            
+            # 空仓库没有默认分支
+            branch = repository.get('defaultBranchRef')
+            if not branch:
+                break
+            
+            history = branch['target']['history']
+            for node in history['nodes']:
+                all_commits.append({
+                    'sha': node['oid'],
+                    'html_url': node['url'],
+                    'commit': {
+                        'message': node['message'],
+                        'author': node['author'],
+                        'committer': node['committer']
+                    }
+                })
+            
+            page_info = history['pageInfo']
+            if not page_info['hasNextPage']:
+                break
+            variables['cursor'] = page_info['endCursor']
+        
+        logger.info("共获取到 %d 个commits(GraphQL): %s/%s (%s ~ %s)", len(all_commits), owner, repo, since, until)
+        self._set_cached_repo_exists(owner, repo, True)
+        return (True, all_commits)
+    
     def parse_repo_url(self, repo_url: str) -> Optional[tuple]:
         """
         解析GitHub仓库URL,提取owner和repo名称
@@ -106,33 +572,13 @@ class GitHubAPIClient:
             # https://github.com/owner/repo
             # https://github.com/owner/repo.git
             # github.com/owner/repo
-            
-            url = repo_url.strip()
-            
-            # 移除协议前缀
-            if url.startswith('http://') or url.startswith('https://'):
-                url = url.split('://', 1)[1]
-            
-            # 移除github.com前缀
-            if url.startswith('github.com/'):
-                url = url[11:]
-            
-            # 移除.git后缀
-            if url.endswith('.git'):
-                url = url[:-4]
-            
-            # 分割owner和repo
-            parts = url.split('/')
-            if len(parts) >= 2:
-                owner = parts[0]
-                repo = parts[1]
-                return (owner, repo)
-            else:
-                logger.warning(f"无法解析仓库URL: {repo_url}")
-                return None
+            repo_info = _parse_repo_url(repo_url.strip())
+            if repo_info is None:
+                logger.warning("无法解析仓库URL: %s", repo_url)
+            return repo_info
                 
         except Exception as e:
-            logger.error(f"解析仓库URL失败: {repo_url}, 错误: {e}")
+            logger.error("解析仓库URL失败: %s, 错误: %s", repo_url, e)
             return None
     
     def check_repo_exists(self, owner: str, repo: str) -> bool:
@@ -145,16 +591,25 @@ class GitHubAPIClient:
             
         Returns:
             True表示存在,False表示不存在或访问失败
+            (存在和确认404的结果会被缓存,超时、5xx、限流等临时失败不缓存,之后会重新检查)
         """
+        cached = self._get_cached_repo_exists(owner, repo)
+        if cached is not None:
+            return cached
+        
         url = f"{self.base_url}/repos/{owner}/{repo}"
         response = self._make_request(url)
+        exists = bool(response)
         
-        if response:
-            logger.info(f"仓库存在: {owner}/{repo}")
-            return True
+        if exists:
+            self._set_cached_repo_exists(owner, repo, True)
+            logger.info("仓库存在: %s/%s", owner, repo)
+        elif self._request_state.last_status == 404:
+            self._set_cached_repo_exists(owner, repo, False)
+            logger.warning("仓库不存在或无法访问: %s/%s", owner, repo)
         else:
-            logger.warning(f"仓库不存在或无法访问: {owner}/{repo}")
-            return False
+            logger.warning("检查仓库失败(临时错误,不缓存结果): %s/%s", owner, repo)
+        return exists
     
     def get_commits_in_time_range(
         self,
@@ -190,21 +645,23 @@ class GitHubAPIClient:
         response = self._make_request(url, params)
         
         if response:
-            logger.info(f"获取到 {len(response)} 个commits: {owner}/{repo}")
+            logger.info("获取到 %d 个commits: %s/%s", len(response), owner, repo)
             return response
         else:
             return []
     
-    def get_all_commits_in_time_range(
+    def iter_commits_in_time_range(
         self,
         owner: str,
         repo: str,
         since: str,
         until: str,
         max_pages: int = 10
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """
-        获取指定时间范围内的所有commits(处理分页)
+        逐个产出指定时间范围内的commits(处理分页)
+        
+        按需请求下一页,调用方处理完一页后该页数据即可释放,不必先汇总成完整列表
         
         Args:
             owner: 仓库所有者
@@ -213,10 +670,10 @@ class GitHubAPIClient:
             until: 结束时间(ISO 8601格式)
             max_pages: 最大页数限制
             
-        Returns:
-            所有commit列表
+        Yields:
+            commit字典
         """
-        all_commits = []
+        total = 0
         page = 1
         
         while page <= max_pages:
@@ -227,7 +684,8 @@ class GitHubAPIClient:
             if not commits:
                 break
             
-            all_commits.extend(commits)
+            total += len(commits)
+            yield from commits
             
             # 如果返回的commit数量少于100,说明已经是最后一页
             if len(commits) < 100:
@@ -235,8 +693,30 @@ class GitHubAPIClient:
             
             page += 1
         
-        logger.info(f"共获取到 {len(all_commits)} 个commits: {owner}/{repo} ({since} ~ {until})")
-        return all_commits
+        logger.info("共获取到 %d 个commits: %s/%s (%s ~ %s)", total, owner, repo, since, until)
+    
+    def get_all_commits_in_time_range(
+        self,
+        owner: str,
+        repo: str,
+        since: str,
+        until: str,
+        max_pages: int = 10
+    ) -> List[Dict]:
+        """
+        获取指定时间范围内的所有commits(处理分页)
+        
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            since: 开始时间(ISO 8601格式)
+            until: 结束时间(ISO 8601格式)
+            max_pages: 最大页数限制
+            
+        Returns:
+            所有commit列表
+        """
+        return list(self.iter_commits_in_time_range(owner, repo, since, until, max_pages))
     
     def get_commit_detail(self, owner: str, repo: str, sha: str) -> Optional[Dict]:
         """
@@ -254,10 +734,10 @@ class GitHubAPIClient:
         response = self._make_request(url)
         
         if response:
-            logger.debug(f"获取commit详情成功: {sha}")
+            logger.debug("获取commit详情成功: %s", sha)
             return response
         else:
-            logger.warning(f"获取commit详情失败: {sha}")
+            logger.warning("获取commit详情失败: %s", sha)
             return None
     
     def get_rate_limit_status(self) -> Dict:
@@ -277,7 +757,7 @@ class GitHubAPIClient:
             reset = core.get('reset', 0)
             reset_time = datetime.fromtimestamp(reset).strftime('%Y-%m-%d %H:%M:%S')
             
-            logger.info(f"API速率限制: {remaining}/{limit}, 重置时间: {reset_time}")
+            logger.info("API速率限制: %s/%s, 重置时间: %s", remaining, limit, reset_time)
             return {
                 'remaining': remaining,
                 'limit': limit,
@@ -4,10 +4,13 @@
 """
 
 import logging
+import os
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 from pathlib import Path
 
 from config import LOG_CONFIG, BATCH_CONFIG
@@ -15,10 +18,32 @@ from database import DatabaseManager
 from github_api import GitHubAPIClient
 from time_utils import TimeRangeCalculator
 
+# 优先使用orjson序列化结果(比标准库json快数倍,输出UTF-8字节),未安装时退回标准库
+try:
+    import orjson
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
 
 class CVECommitExtractor:
     """CVE-Commit提取主类"""
     
+    # 结果中保留的commit message最大长度,完整内容可按sha重新获取
+    MAX_MESSAGE_LENGTH = 2048
+    
+    # 处理CVE异常时输出完整堆栈的最小间隔(秒),GitHub故障期间连续出错只记一次堆栈
+    TRACEBACK_LOG_INTERVAL = 60
+    
+    # 每个CVE最多获取的commit页数,以及GitHub每页返回的commit数(REST和GraphQL均为100)
+    MAX_PAGES_PER_CVE = 10
+    COMMITS_PER_PAGE = 100
+    # 同一仓库合并时间窗口后一次请求的页数预算(固定值,不随合并的CVE数量放大)
+    MAX_PAGES_PER_MERGED_WINDOW = MAX_PAGES_PER_CVE
+    
     def __init__(self):
         """初始化提取器"""
         # 设置日志
@@ -40,8 +65,17 @@ class CVECommitExtractor:
             'end_time': None
         }
         
-        # 结果存储
-        self.results = []
+        # 多线程处理时保护统计信息
+        self._stats_lock = threading.Lock()
+        self._last_traceback_ts = float('-inf')
+        
+        # 结果文件: 每个CVE的结果追加一行到NDJSON文件,统计信息单独写入元数据文件
+        self.results_file = None
+        self.metadata_file = None
+        self._run_timestamp = None
+        # 后台I/O线程: 结果和元数据的写盘不阻塞结果收集
+        self._io_executor = None
+        self._results_fp = None
     
     def _setup_logging(self):
         """配置日志系统"""
@@ -64,7 +98,111 @@ class CVECommitExtractor:
         self.logger.info("CVE-Commit提取程序启动")
         self.logger.info("="*60)
     
-    def process_single_cve(self, cve_id: str, published_date: str, repo_url: str) -> Dict:
+    def _incr_stat(self, key: str, n: int = 1):
+        """
+        线程安全地累加统计计数
+        
+        Args:
+            key: 统计项名称
+            n: 增量
+        """
+        with self._stats_lock:
+            self.stats[key] += n
+    
+    def _should_log_traceback(self) -> bool:
+        """
+        判断本次异常是否输出完整堆栈(每TRACEBACK_LOG_INTERVAL秒最多一次)
+        
+        Returns:
+            True表示输出堆栈
+        """
+        now = time.monotonic()
+        with self._stats_lock:
+            if now - self._last_traceback_ts < self.TRACEBACK_LOG_INTERVAL:
+                return False
+            self._last_traceback_ts = now
+            return True
+    
+    def _commit_info(self, commit: Dict) -> Tuple[str, Dict]:
+        """
+        将GitHub返回的commit转换为结果中保存的精简信息
+        
+        Args:
+            commit: GitHub API返回的commit(REST结构)
+            
+        Returns:
+            (committer时间, commit信息字典),committer时间用于按时间窗口筛选
+        """
+        try:
+            # GitHub返回的commit字段齐全,直接取键,避免每层.get都构造默认空字典
+            commit_data = commit['commit']
+            author = commit_data['author']
+            commit_info = {
+                'sha': commit['sha'],
+                'message': commit_data['message'][:self.MAX_MESSAGE_LENGTH],
+                'author_email': author['email'],
+                'date': author['date']
+            }
+            return (commit_data['committer']['date'], commit_info)
+        except (KeyError, TypeError):
+            # 字段缺失或为null(如GraphQL中author为None)时逐层取默认值
+            commit_data = commit.get('commit') or {}
+            author = commit_data.get('author') or {}
+            committer = commit_data.get('committer') or {}
+            commit_info = {
+                'sha': commit.get('sha', ''),
+                'message': (commit_data.get('message') or '')[:self.MAX_MESSAGE_LENGTH],
+                'author_email': author.get('email', ''),
+                'date': author.get('date', '')
+            }
+            return (committer.get('date', ''), commit_info)
+    
+    def _fetch_repo_commits(
+        self,
+        owner: str,
+        repo: str,
+        since: str,
+        until: str,
+        max_pages: int = MAX_PAGES_PER_CVE
+    ) -> Tuple[bool, List[Tuple[str, Dict]]]:
+        """
+        获取仓库存在性和时间范围内的所有commits
+        
+        优先GraphQL(一个请求完成),不可用时退回REST(检查仓库 + 分页获取)
+        
+        Args:
+            owner: 仓库所有者
+            repo: 仓库名称
+            since: 开始时间(ISO 8601格式)
+            until: 结束时间(ISO 8601格式)
+            max_pages: 最大页数限制
+            
+        Returns:
+            (仓库是否存在, [(committer时间, commit信息), ...])
+        """
+        if self.github.use_graphql:
+            graphql_result = self.github.get_commits_graphql(
+                owner, repo, since, until, max_pages=max_pages
+            )
+            if graphql_result is not None:
+                repo_exists, commits = graphql_result
+                return (repo_exists, [self._commit_info(commit) for commit in commits])
+        
+        if not self.github.check_repo_exists(owner, repo):
+            return (False, [])
+        # 逐页转换为精简信息,原始响应数据用完即可释放
+        commits = self.github.iter_commits_in_time_range(
+            owner, repo, since, until, max_pages=max_pages
+        )
+        return (True, [self._commit_info(commit) for commit in commits])
+    
+    def process_single_cve(
+        self,
+        cve_id: str,
+        published_date: str,
+        repo_url: str,
+        fetch_commits: Optional[Callable] = None
+    ) -> Dict:
         """
         处理单个CVE,提取时间范围内的所有commits
         
@@ -72,6 +210,7 @@ class CVECommitExtractor:
             cve_id: CVE编号
             published_date: CVE披露时间
             repo_url: GitHub仓库URL
+            fetch_commits: 获取commits的函数,签名同_fetch_repo_commits,默认直接请求GitHub
             
         Returns:
             处理结果字典
@@ -87,73 +226,62 @@ class CVECommitExtractor:
         }
         
         try:
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"处理CVE: {cve_id}")
-            self.logger.info(f"  仓库: {repo_url}")
-            self.logger.info(f"  披露时间: {published_date}")
+            self.logger.info("\n%s", "=" * 60)
+            self.logger.info("处理CVE: %s", cve_id)
+            self.logger.info("  仓库: %s", repo_url)
+            self.logger.info("  披露时间: %s", published_date)
             
             # 1. 解析仓库URL
             repo_info = self.github.parse_repo_url(repo_url)
             if not repo_info:
                 result['status'] = 'error'
                 result['message'] = '无法解析仓库URL'
-                self.stats['api_errors'] += 1
+                self._incr_stat('api_errors')
                 return result
             
             owner, repo = repo_info
-            self.logger.info(f"  解析仓库: {owner}/{repo}")
+            self.logger.info("  解析仓库: %s/%s", owner, repo)
             
-            # 2. 检查仓库是否存在
-            if not self.github.check_repo_exists(owner, repo):
+            # 2. 计算时间范围
+            since, until = self.time_calc.calculate_time_range(published_date)
+            self.logger.info("  搜索时间范围: %s ~ %s", since, until)
+            
+            # 3. 获取仓库存在性和时间范围内的所有commits
+            fetch_commits = fetch_commits or self._fetch_repo_commits
+            repo_exists, commits = fetch_commits(owner, repo, since, until)
+            
+            if not repo_exists:
                 result['status'] = 'repo_not_found'
                 result['message'] = '仓库不存在或无法访问'
-                self.stats['repo_not_found'] += 1
-                self.logger.warning(f"  仓库不存在或无法访问: {owner}/{repo}")
+                self._incr_stat('repo_not_found')
+                self.logger.warning("  仓库不存在或无法访问: %s/%s", owner, repo)
                 return result
             
-            # 3. 计算时间范围
-            since, until = self.time_calc.calculate_time_range(published_date)
             result['time_range'] = {
                 'since': since,
                 'until': until
             }
-            self.logger.info(f"  搜索时间范围: {since} ~ {until}")
-            
-            # 4. 获取时间范围内的所有commits
-            commits = self.github.get_all_commits_in_time_range(
-                owner, repo, since, until, max_pages=10
-            )
             
             if not commits:
                 result['message'] = '在指定时间范围内未找到任何commit'
-                self.logger.info(f"  未找到任何commit")
+                self.logger.info("  未找到任何commit")
                 return result
             
-            self.logger.info(f"  找到 {len(commits)} 个commits")
-            
-            # 5. 提取所有commit信息
-            for commit in commits:
-                commit_info = {
-                    'sha': commit.get('sha', ''),
-                    'message': commit.get('commit', {}).get('message', ''),
-                    'author': commit.get('commit', {}).get('author', {}).get('name', ''),
-                    'author_email': commit.get('commit', {}).get('author', {}).get('email', ''),
-                    'date': commit.get('commit', {}).get('author', {}).get('date', ''),
-                    'committer': commit.get('commit', {}).get('committer', {}).get('name', ''),
-                    'committer_date': commit.get('commit', {}).get('committer', {}).get('date', ''),
-                    'html_url': commit.get('html_url', '')
-                }
-                result['commits'].append(commit_info)
-            
-            self.stats['total_commits'] += len(commits)
+            self.logger.info("  找到 %d 个commits", len(commits))
+            
+            # 4. 保存commit信息(获取时已转换为精简字段,见_commit_info)
+            result['commits'] = [commit_info for _, commit_info in commits]
+            
+            self._incr_stat('total_commits', len(commits))
             result['message'] = f'成功提取 {len(commits)} 个commits'
-            self.logger.info(f"  ✓ 成功提取 {len(commits)} 个commits")
+            self.logger.info("  ✓ 成功提取 %d 个commits", len(commits))
             
         except Exception as e:
             result['status'] = 'error'
             result['message'] = f'处理异常: {str(e)}'
-            self.stats['api_errors'] += 1
-            self.logger.error(f"  处理CVE时发生异常: {e}", exc_info=True)
+            self._incr_stat('api_errors')
+            self.logger.error("  处理CVE %s 时发生异常: %r", cve_id, e,
+                              exc_info=self._should_log_traceback())
         
         return result
     
@@ -174,38 +302,45 @@ class CVECommitExtractor:
             self.stats['total_cves'] = total_count
             self.logger.info(f"数据库中共有 {total_count} 个CVE")
             
-            # 获取待处理的CVEs
-            cves = self.db.get_cve_with_repos(limit=limit, offset=offset)
+            # 获取待处理的CVEs(需要总数显示进度,这里一次性读完)
+            cves = list(self.db.get_cve_with_repos(limit=limit, offset=offset))
             process_count = len(cves)
             self.logger.info(f"本次将处理 {process_count} 个CVE (偏移: {offset})")
             
             # 记录开始时间
             self.stats['start_time'] = time.time()
             
-            # 检查API速率限制
-            rate_status = self.github.get_rate_limit_status()
-            self.logger.info(f"API速率限制状态: {rate_status['remaining']}/{rate_status['limit']}")
+            # 打开结果文件,处理过程中逐条追加
+            # 文件名时间戳每次运行只计算一次,成功完成后文件改名为final
+            self._run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self.results_file, self.metadata_file = self._result_file_names('cve_commit_results')
+            self._results_fp = open(self.results_file, 'wb')
+            self._io_executor = ThreadPoolExecutor(max_workers=1)
+            self.logger.info(f"结果将写入: {self.results_file}")
             
-            # 逐个处理CVE
-            for idx, cve_record in enumerate(cves, 1):
-                cve_id = cve_record['cve_id']
-                published_date = cve_record['published_date']
-                repo_url = cve_record['repo_url']
-                
-                self.logger.info(f"\n进度: {idx}/{process_count}")
-                
-                # 处理单个CVE
-                result = self.process_single_cve(cve_id, published_date, repo_url)
-                self.results.append(result)
-                self.stats['processed_cves'] += 1
-                
-                # 定期保存结果
-                if idx % BATCH_CONFIG['batch_size'] == 0:
-                    self._save_intermediate_results()
-                    self.logger.info(f"已保存中间结果 (处理了 {idx} 个CVE)")
-                
-                # 短暂休眠,避免API速率限制
-                time.sleep(0.5)
+            # 按仓库分组,同一仓库的CVE共用仓库检查和重叠时间窗口的commit请求
+            groups = self._group_by_repo(cves)
+            self.logger.info(f"涉及 {len(groups)} 个仓库")
+            
+            # 并发处理各仓库(GitHub请求为I/O密集型,用线程池重叠网络等待),结果按分组顺序收集
+            executor = ThreadPoolExecutor(max_workers=BATCH_CONFIG['max_workers'])
+            try:
+                idx = 0
+                for group_results in executor.map(self._process_repo_group, groups):
+                    for result in group_results:
+                        idx += 1
+                        self.logger.info("\n进度: %d/%d", idx, process_count)
+                        self._write_result(result)
+                        self.stats['processed_cves'] += 1
+                        
+                        # 定期保存结果
+                        if idx % BATCH_CONFIG['batch_size'] == 0:
+                            self._save_intermediate_results()
+                            self.logger.info(f"已保存中间结果 (处理了 {idx} 个CVE)")
+                            self._log_rate_limit_status()
+            finally:
+                # 中断时取消尚未开始的任务,只等待正在执行的任务
+                executor.shutdown(wait=True, cancel_futures=True)
             
             # 记录结束时间
             self.stats['end_time'] = time.time()
@@ -225,47 +360,259 @@ class CVECommitExtractor:
             self.logger.error(f"程序执行出错: {e}", exc_info=True)
             
         finally:
-            # 关闭数据库连接
+            # 等待后台写入完成,关闭结果文件、数据库连接和HTTP会话
+            self._wait_for_io()
+            if self._results_fp is not None:
+                self._results_fp.close()
+                self._results_fp = None
             self.db.disconnect()
+            self.github.close()
+    
+    def _log_rate_limit_status(self):
+        """输出API速率限制状态(取自响应头,不额外请求/rate_limit)"""
+        for resource, state in list(self.github.rate_state.items()):
+            self.logger.info(f"API速率限制状态({resource}): {state['remaining']}/{state['limit']}")
+    
+    def _group_by_repo(self, cves: List[Dict]) -> List[List[Dict]]:
+        """
+        按仓库(owner/repo,不区分大小写)对CVE记录分组
+        
+        Args:
+            cves: CVE记录列表
+            
+        Returns:
+            按仓库排序的分组列表,组内保持原顺序;无法解析的URL各自成组
+        """
+        groups = {}
+        # 同一URL通常对应很多CVE,每个不同的URL只解析一次
+        repo_keys = {}
+        for cve_record in cves:
+            repo_url = cve_record['repo_url']
+            key = repo_keys.get(repo_url)
+            if key is None:
+                repo_info = self.github.parse_repo_url(repo_url)
+                if repo_info:
+                    key = (repo_info[0].lower(), repo_info[1].lower())
+                else:
+                    key = ('', repo_url)
+                repo_keys[repo_url] = key
+            groups.setdefault(key, []).append(cve_record)
+        return [groups[key] for key in sorted(groups)]
+    
+    @staticmethod
+    def _merge_windows(windows: List[Tuple[str, str]]) -> List[Tuple[Tuple[str, str], int]]:
+        """
+        合并重叠的时间窗口
+        
+        Args:
+            windows: (since, until)列表,时间格式为'%Y-%m-%dT%H:%M:%SZ',可直接按字符串比较
+            
+        Returns:
+            [((since, until), 被合并的窗口数), ...]
+        """
+        merged = []
+        for since, until in sorted(windows):
+            if merged and since <= merged[-1][0][1]:
+                (last_since, last_until), count = merged[-1]
+                merged[-1] = ((last_since, max(last_until, until)), count + 1)
+            else:
+                merged.append(((since, until), 1))
+        return merged
+    
+    def _process_repo_group(self, cve_records: List[Dict]) -> List[Dict]:
+        """
+        线程池任务: 处理同一仓库的一组CVE记录
+        
+        重叠的时间窗口合并后每个只请求一次,再按各CVE自己的时间范围过滤commits;
+        合并窗口的commits超出固定页数预算(被截断)时说明仓库提交密集,合并并不省请求,
+        该窗口内的CVE退回单独请求,组内其余窗口也不再合并
+        
+        Args:
+            cve_records: 同一仓库的CVE记录列表
+            
+        Returns:
+            处理结果字典列表,顺序与cve_records一致
+        """
+        if len(cve_records) == 1:
+            return [self._process_cve_record(cve_records[0])]
+        
+        ranges = []
+        windows = {}
+        for cve_record in cve_records:
+            try:
+                window = self.time_calc.calculate_time_window(cve_record['published_date'])
+            except Exception:
+                # 时间无法解析的CVE由process_single_cve照常记录错误
+                continue
+            ranges.append((window.since, window.until))
+            windows[ranges[-1]] = window
+        merged = self._merge_windows(ranges)
+        fetched = {}
+        fetched_single = {}
+        dense_repo = False
+        
+        def fetch_single(
+            owner: str, repo: str, since: str, until: str
+        ) -> Tuple[bool, List[Tuple[str, Dict]]]:
+            # 按CVE自己的时间范围单独请求,相同范围只请求一次
+            if (since, until) not in fetched_single:
+                fetched_single[(since, until)] = self._fetch_repo_commits(owner, repo, since, until)
+            return fetched_single[(since, until)]
+        
+        def fetch_commits(
+            owner: str, repo: str, since: str, until: str
+        ) -> Tuple[bool, List[Tuple[str, Dict]]]:
+            nonlocal dense_repo
+            for window, count in merged:
+                if window[0] <= since and until <= window[1]:
+                    break
+            else:
+                return self._fetch_repo_commits(owner, repo, since, until)
+            
+            if window not in fetched:
+                if count > 1 and dense_repo:
+                    # 组内已有合并窗口超出预算,不再合并
+                    return fetch_single(owner, repo, since, until)
+                max_pages = self.MAX_PAGES_PER_MERGED_WINDOW
+                repo_exists, commits = self._fetch_repo_commits(
+                    owner, repo, window[0], window[1], max_pages=max_pages
+                )
+                truncated = len(commits) >= max_pages * self.COMMITS_PER_PAGE
+                dense_repo = dense_repo or (truncated and count > 1)
+                # commit时间只解析一次,组内各CVE只需与自己窗口的时间戳边界比较
+                timestamps = self.time_calc.parse_commit_timestamps([commit[0] for commit in commits])
+                fetched[window] = (repo_exists, commits, truncated, timestamps)
+            repo_exists, commits, truncated, timestamps = fetched[window]
+            
+            if truncated and window != (since, until):
+                # 合并窗口超出页数预算时结果从最新的commit开始截断,较早CVE的时间范围
+                # 可能完全没有取到,此时退回按该CVE自己的时间范围单独请求
+                return fetch_single(owner, repo, since, until)
+            
+            # 与单独请求时一样,每个CVE最多保留最新的MAX_PAGES_PER_CVE页commits
+            in_range = self.time_calc.timestamps_in_window(timestamps, windows[(since, until)])
+            commits = [commit for commit, keep in zip(commits, in_range) if keep]
+            return repo_exists, commits[:self.MAX_PAGES_PER_CVE * self.COMMITS_PER_PAGE]
+        
+        return [self._process_cve_record(cve_record, fetch_commits) for cve_record in cve_records]
+    
+    def _process_cve_record(self, cve_record: Dict, fetch_commits: Optional[Callable] = None) -> Dict:
+        """
+        处理一条CVE记录
+        
+        Args:
+            cve_record: 包含cve_id, published_date, repo_url的记录
+            fetch_commits: 获取commits的函数,见process_single_cve
+            
+        Returns:
+            处理结果字典
+        """
+        return self.process_single_cve(
+            cve_record['cve_id'], cve_record['published_date'], cve_record['repo_url'],
+            fetch_commits
+        )
+    
+    def _submit_io(self, fn: Callable, *args):
+        """
+        在后台I/O线程执行写操作(单线程,按提交顺序执行);I/O线程未启动时直接执行
+        
+        Args:
+            fn: 写操作函数
+            *args: 函数参数
+        """
+        if self._io_executor is None:
+            fn(*args)
+        else:
+            self._io_executor.submit(fn, *args)
+    
+    def _wait_for_io(self):
+        """等待后台写操作全部完成并关闭I/O线程"""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+    
+    def _write_result(self, result: Dict):
+        """
+        追加一条CVE处理结果到NDJSON结果文件(序列化在当前线程,写盘在后台I/O线程)
+        
+        Args:
+            result: 处理结果字典
+        """
+        self._submit_io(self._append_result_line, _json_dumps(result) + b'\n')
+    
+    def _append_result_line(self, line: bytes):
+        """
+        写入一行结果并刷新到磁盘
+        
+        Args:
+            line: 已序列化的一行JSON
+        """
+        try:
+            self._results_fp.write(line)
+            self._results_fp.flush()
+        except Exception as e:
+            self.logger.error(f"写入结果失败: {e}")
     
     def _save_intermediate_results(self):
-        """保存中间结果"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'cve_commit_results_intermediate_{timestamp}.json'
-        self._save_results_to_file(filename)
+        """保存中间结果(结果已逐条写入,这里只更新元数据)"""
+        if self._results_fp is None:
+            return
+        self._save_metadata()
+    
+    def _result_file_names(self, prefix: str) -> Tuple[str, str]:
+        """
+        生成本次运行的结果文件名和元数据文件名
+        
+        Args:
+            prefix: 文件名前缀
+            
+        Returns:
+            (结果文件名, 元数据文件名)
+        """
+        stem = f'{prefix}_{self._run_timestamp}'
+        return (f'{stem}.ndjson', f'{stem}_metadata.json')
     
     def _save_final_results(self):
-        """保存最终结果"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'cve_commit_results_final_{timestamp}.json'
-        self._save_results_to_file(filename)
-        self.logger.info(f"\n最终结果已保存到: {filename}")
+        """保存最终结果: 关闭结果文件并改名为final,写入最终元数据"""
+        self._wait_for_io()
+        self._results_fp.close()
+        self._results_fp = None
+        
+        results_file, metadata_file = self._result_file_names('cve_commit_results_final')
+        os.replace(self.results_file, results_file)
+        if os.path.exists(self.metadata_file):
+            os.remove(self.metadata_file)
+        self.results_file, self.metadata_file = results_file, metadata_file
+        
+        self._save_metadata()
+        self.logger.info(f"\n最终结果已保存到: {self.results_file}")
     
-    def _save_results_to_file(self, filename: str):
+    def _save_metadata(self):
+        """保存统计信息到元数据JSON文件(统计快照在当前线程生成,写盘在后台I/O线程)"""
+        metadata = {
+            'timestamp': datetime.now().isoformat(),
+            'results_file': self.results_file,
+            'total_cves': self.stats['total_cves'],
+            'processed_cves': self.stats['processed_cves'],
+            'total_commits': self.stats['total_commits'],
+            'repo_not_found': self.stats['repo_not_found'],
+            'api_errors': self.stats['api_errors']
+        }
+        self._submit_io(self._write_metadata_file, self.metadata_file, _json_dumps(metadata, indent=True))
+    
+    def _write_metadata_file(self, filename: str, payload: bytes):
         """
-        保存结果到JSON文件
+        写入元数据文件
         
         Args:
             filename: 文件名
+            payload: 已序列化的JSON
         """
-        output = {
-            'metadata': {
-                'timestamp': datetime.now().isoformat(),
-                'total_cves': self.stats['total_cves'],
-                'processed_cves': self.stats['processed_cves'],
-                'total_commits': self.stats['total_commits'],
-                'repo_not_found': self.stats['repo_not_found'],
-                'api_errors': self.stats['api_errors']
-            },
-            'results': self.results
-        }
-        
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"结果已保存到: {filename}")
+            Path(filename).write_bytes(payload)
+            self.logger.info(f"元数据已保存到: {filename}")
         except Exception as e:
-            self.logger.error(f"保存结果失败: {e}")
+            self.logger.error(f"保存元数据失败: {e}")
     
     def _print_statistics(self):
         """打印统计信息"""
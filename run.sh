@@ -105,4 +105,4 @@ echo "处理完成"
 echo "===================================="
 echo "查看结果:"
 echo "  - 日志文件: cve_commit_matching.log"
-echo "  - 结果文件: cve_commit_results_final_*.json"
+echo "  - 结果文件: cve_commit_results_*.ndjson"
@@ -0,0 +1,66 @@
+"""
+Commit匹配评分测试
+运行: python -m unittest test_commit_matcher
+"""
+
+import unittest
+
+from commit_matcher import CommitMatcher
+
+
+class CalculateMatchScoreTest(unittest.TestCase):
+    """calculate_match_score评分测试"""
+
+    TARGET = 'cve-2020-1234'
+
+    def setUp(self):
+        self.matcher = CommitMatcher()
+
+    def test_target_cve_case_insensitive(self):
+        """直接提到目标CVE(不区分大小写)加100分,再加修复关键词分"""
+        score, patterns, cve_ids = self.matcher.calculate_match_score(
+            'Fix CVE-2020-1234: buffer overflow in auth module', self.TARGET
+        )
+        self.assertEqual(score, 120)
+        self.assertEqual(cve_ids, {'CVE-2020-1234'})
+        self.assertEqual(patterns, [
+            '直接提到CVE: cve-2020-1234', '修复关键词: fix', '修复关键词: buffer overflow'
+        ])
+
+    def test_other_cves(self):
+        """只提到其他CVE时加20分,小写写法也能提取"""
+        score, _, cve_ids = self.matcher.calculate_match_score(
+            'Security patch for cve-2020-5678 and CVE-2020-9012', self.TARGET
+        )
+        self.assertEqual(score, 40)
+        self.assertEqual(cve_ids, {'CVE-2020-5678', 'CVE-2020-9012'})
+
+    def test_fix_keywords_capped(self):
+        """修复关键词最多计5个(+50分),按关键词表顺序"""
+        score, patterns, _ = self.matcher.calculate_match_score(
+            'fix fixes fixed fixing patch patched', self.TARGET
+        )
+        self.assertEqual(score, 50)
+        self.assertEqual(patterns, [
+            '修复关键词: fix', '修复关键词: fixes', '修复关键词: fixed',
+            '修复关键词: fixing', '修复关键词: patch'
+        ])
+
+    def test_exclude_keywords_capped(self):
+        """排除关键词最多计6个(-30分)"""
+        score, patterns, _ = self.matcher.calculate_match_score(
+            'test tests testing doc docs documentation readme', self.TARGET
+        )
+        self.assertEqual(score, -30)
+        self.assertEqual(len(patterns), 6)
+
+    def test_short_message(self):
+        """关键词按子串匹配;少于20个字符的消息扣10分"""
+        score, patterns, cve_ids = self.matcher.calculate_match_score('Prefix handling', self.TARGET)
+        self.assertEqual(score, 0)
+        self.assertEqual(patterns, ['修复关键词: fix', '消息过短'])
+        self.assertEqual(cve_ids, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
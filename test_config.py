@@ -29,10 +29,10 @@ def test_imports():
         return False
     
     try:
-        from dateutil import relativedelta
-        logger.info("  ✓ python-dateutil 已安装")
+        import numpy
+        logger.info("  ✓ numpy 已安装")
     except ImportError:
-        logger.error("  ✗ python-dateutil 未安装,请运行: pip install python-dateutil")
+        logger.error("  ✗ numpy 未安装,请运行: pip install numpy")
         return False
     
     return True
@@ -82,9 +82,8 @@ def test_database():
         logger.info(f"  ✓ 查询成功,数据库中有 {count} 个CVE")
         
         # 获取一条样本数据
-        cves = db.get_cve_with_repos(limit=1)
-        if cves:
-            cve = cves[0]
+        cve = next(db.get_cve_with_repos(limit=1), None)
+        if cve:
             logger.info(f"  ✓ 样本数据: {cve['cve_id']} -> {cve['repo_url']}")
         
         db.disconnect()
@@ -170,7 +169,7 @@ def test_commit_matcher():
         logger.info(f"  ✓ CVE提取成功: '{test_message[:50]}...' -> {cves}")
         
         # 测试分数计算
-        score, patterns = matcher.calculate_match_score(test_message, "CVE-2020-1234")
+        score, patterns, _ = matcher.calculate_match_score(test_message, "CVE-2020-1234")
         logger.info(f"  ✓ 分数计算成功: 分数={score}, 匹配模式数={len(patterns)}")
         
         return True
@@ -0,0 +1,53 @@
+"""
+CVE-Commit提取主程序测试
+运行: python -m unittest test_main
+"""
+
+import unittest
+
+from main import CVECommitExtractor
+
+
+class MergeWindowsTest(unittest.TestCase):
+    """_merge_windows时间窗口合并测试"""
+
+    def test_overlapping_windows_merged(self):
+        """重叠或首尾相接的窗口合并,并记录被合并的窗口数"""
+        windows = [
+            ('2020-03-01T00:00:00Z', '2020-09-01T00:00:00Z'),
+            ('2020-01-01T00:00:00Z', '2020-06-01T00:00:00Z'),
+            ('2020-09-01T00:00:00Z', '2020-10-01T00:00:00Z'),
+        ]
+        self.assertEqual(CVECommitExtractor._merge_windows(windows), [
+            (('2020-01-01T00:00:00Z', '2020-10-01T00:00:00Z'), 3),
+        ])
+
+    def test_disjoint_windows_kept(self):
+        """不重叠的窗口各自保留,按开始时间排序"""
+        windows = [
+            ('2021-01-01T00:00:00Z', '2021-06-01T00:00:00Z'),
+            ('2020-01-01T00:00:00Z', '2020-06-01T00:00:00Z'),
+        ]
+        self.assertEqual(CVECommitExtractor._merge_windows(windows), [
+            (('2020-01-01T00:00:00Z', '2020-06-01T00:00:00Z'), 1),
+            (('2021-01-01T00:00:00Z', '2021-06-01T00:00:00Z'), 1),
+        ])
+
+    def test_contained_and_duplicate_windows(self):
+        """被包含的窗口不会缩短结束时间,相同窗口也计入数量"""
+        windows = [
+            ('2020-01-01T00:00:00Z', '2020-12-01T00:00:00Z'),
+            ('2020-03-01T00:00:00Z', '2020-04-01T00:00:00Z'),
+            ('2020-01-01T00:00:00Z', '2020-12-01T00:00:00Z'),
+        ]
+        self.assertEqual(CVECommitExtractor._merge_windows(windows), [
+            (('2020-01-01T00:00:00Z', '2020-12-01T00:00:00Z'), 3),
+        ])
+
+    def test_empty(self):
+        """没有窗口时返回空列表"""
+        self.assertEqual(CVECommitExtractor._merge_windows([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+时间处理工具测试
+运行: python -m unittest test_time_utils
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from time_utils import (
+    calculate_time_range, calculate_time_window, filter_commits_in_range,
+    format_datetime_for_github, is_commit_in_window, parse_commit_timestamps,
+    parse_cve_published_date, timestamps_in_window
+)
+
+
+class ParseCvePublishedDateTest(unittest.TestCase):
+    """parse_cve_published_date解析测试"""
+
+    def test_fixed_width_formats(self):
+        """分钟/秒/小数秒精度的Z结尾时间"""
+        self.assertEqual(parse_cve_published_date('2020-02-04T17:15Z'), datetime(2020, 2, 4, 17, 15))
+        self.assertEqual(parse_cve_published_date('2020-02-04T17:15:30Z'), datetime(2020, 2, 4, 17, 15, 30))
+        self.assertEqual(
+            parse_cve_published_date('2020-02-04T17:15:30.123Z'),
+            datetime(2020, 2, 4, 17, 15, 30, 123000)
+        )
+
+    def test_date_only_and_offset(self):
+        """只有日期、带时区偏移的写法"""
+        self.assertEqual(parse_cve_published_date('2020-02-04'), datetime(2020, 2, 4))
+        self.assertEqual(
+            parse_cve_published_date('2020-02-04T17:15:30+08:00'),
+            datetime(2020, 2, 4, 17, 15, 30, tzinfo=timezone(timedelta(hours=8)))
+        )
+
+    def test_year_below_1000(self):
+        """补零的4位年份"""
+        self.assertEqual(parse_cve_published_date('0999-03-31T00:00Z'), datetime(999, 3, 31))
+
+    def test_invalid(self):
+        """非法日期抛出ValueError"""
+        for value in ('', 'bad', '2020-13-45T00:00Z'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_cve_published_date(value)
+
+
+class CalculateTimeRangeTest(unittest.TestCase):
+    """calculate_time_range时间范围计算测试"""
+
+    def test_range(self):
+        """前后各加减整月,输出GitHub API格式"""
+        self.assertEqual(
+            calculate_time_range('2020-02-04T17:15Z', 6, 6),
+            ('2019-08-04T17:15:00Z', '2020-08-04T17:15:00Z')
+        )
+
+    def test_month_end_clamped(self):
+        """目标月份没有该日期时取月末(含闰年2月)"""
+        self.assertEqual(
+            calculate_time_range('2020-03-31T10:00Z', 1, 1),
+            ('2020-02-29T10:00:00Z', '2020-04-30T10:00:00Z')
+        )
+        self.assertEqual(
+            calculate_time_range('2020-08-31T10:00Z', 6, 6),
+            ('2020-02-29T10:00:00Z', '2021-02-28T10:00:00Z')
+        )
+
+    def test_across_years(self):
+        """超过12个月时跨年"""
+        self.assertEqual(
+            calculate_time_range('2020-01-15T00:00Z', 13, 13),
+            ('2018-12-15T00:00:00Z', '2021-02-15T00:00:00Z')
+        )
+
+    def test_year_below_1000_zero_padded(self):
+        """年份小于1000时补足4位,保证是合法的ISO 8601"""
+        self.assertEqual(
+            calculate_time_range('0999-06-15T00:00Z', 6, 6),
+            ('0998-12-15T00:00:00Z', '0999-12-15T00:00:00Z')
+        )
+        self.assertEqual(format_datetime_for_github(datetime(999, 1, 2, 3, 4, 5)), '0999-01-02T03:04:05Z')
+
+
+class FilterCommitsInRangeTest(unittest.TestCase):
+    """filter_commits_in_range批量筛选测试"""
+
+    SINCE = '2020-01-01T00:00:00Z'
+    UNTIL = '2021-01-01T00:00:00Z'
+
+    def setUp(self):
+        # 披露时间前后各6个月,即[SINCE, UNTIL]
+        self.window = calculate_time_window('2020-07-01T00:00Z', 6, 6)
+
+    def test_utc_dates(self):
+        """Z结尾的UTC时间,边界包含在范围内"""
+        dates = ['2019-12-31T23:59:59Z', self.SINCE, '2020-06-01T12:00:00Z', self.UNTIL, '2021-01-01T00:00:01Z']
+        mask = filter_commits_in_range(dates, self.window)
+        self.assertEqual(mask.tolist(), [False, True, True, True, False])
+
+    def test_offset_dates(self):
+        """带时区偏移的时间按UTC比较"""
+        dates = ['2020-01-01T07:59:59+08:00', '2020-01-01T08:00:00+08:00']
+        mask = filter_commits_in_range(dates, self.window)
+        self.assertEqual(mask.tolist(), [False, True])
+
+    def test_empty_and_malformed_dates(self):
+        """缺失(空字符串)或无法解析的时间判为不在范围内,不影响其他commit"""
+        dates = ['2020-06-01T12:00:00Z', '', 'not-a-date', '2020-13-45T00:00:00Z', '2020-07-01T00:00:00+02:00']
+        mask = filter_commits_in_range(dates, self.window)
+        self.assertEqual(mask.tolist(), [True, False, False, False, True])
+
+    def test_empty_list(self):
+        """空列表返回空数组"""
+        self.assertEqual(len(filter_commits_in_range([], self.window)), 0)
+
+    def test_window_bounds(self):
+        """窗口的字符串边界与时间戳边界一致"""
+        self.assertEqual((self.window.since, self.window.until), (self.SINCE, self.UNTIL))
+        mask = filter_commits_in_range([self.SINCE, self.UNTIL], self.window)
+        self.assertEqual(mask.tolist(), [True, True])
+
+    def test_fractional_seconds(self):
+        """带小数秒的时间按微秒比较,until之后不足1秒也判为不在范围内"""
+        dates = ['2019-12-31T23:59:59.999999Z', '2020-12-31T23:59:59.999999Z', '2021-01-01T00:00:00.000001Z']
+        mask = filter_commits_in_range(dates, self.window)
+        self.assertEqual(mask.tolist(), [False, True, False])
+
+    def test_matches_is_commit_in_window(self):
+        """批量筛选与逐个检查的结果一致"""
+        dates = [
+            '2019-12-31T23:59:59Z', self.SINCE, '2020-06-01T12:00:00.5Z',
+            '2021-01-01T07:59:59+08:00', '2021-01-01T08:00:01+08:00', self.UNTIL
+        ]
+        mask = filter_commits_in_range(dates, self.window)
+        self.assertEqual(mask.tolist(), [is_commit_in_window(date, self.window) for date in dates])
+
+
+    def test_timestamps_parsed_once(self):
+        """同一批时间戳可与多个窗口比较,结果与逐窗口筛选一致"""
+        dates = ['2019-08-01T00:00:00Z', '2020-03-01T00:00:00Z', '2020-10-01T00:00:00Z', '']
+        timestamps = parse_commit_timestamps(dates)
+        for published_date in ('2019-12-01T00:00Z', '2020-07-01T00:00Z', '2021-03-01T00:00Z'):
+            window = calculate_time_window(published_date, 6, 6)
+            self.assertEqual(
+                timestamps_in_window(timestamps, window).tolist(),
+                filter_commits_in_range(dates, window).tolist()
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,166 +3,607 @@
 负责处理CVE披露时间和commit时间的相关操作
 """
 
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from config import TIME_RANGE_CONFIG
 
+# 优先使用ciso8601解析GitHub commit时间(C实现,原生支持末尾的Z),未安装时退回标准库
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
 logger = logging.getLogger(__name__)
 
+# Python 3.11起datetime.fromisoformat原生支持末尾的Z,不必先替换为+00:00
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
 
-class TimeRangeCalculator:
-    """时间范围计算类"""
+# CVE披露时间支持的格式(按尝试顺序)
+_CVE_DATE_FORMATS = (
+    '%Y-%m-%dT%H:%MZ',          # 2020-02-04T17:15Z
+    '%Y-%m-%dT%H:%M:%SZ',       # 2020-02-04T17:15:30Z
+    '%Y-%m-%dT%H:%M:%S.%fZ',    # 2020-02-04T17:15:30.123Z
+    '%Y-%m-%d %H:%M:%S',        # 2020-02-04 17:15:30
+    '%Y-%m-%d',                 # 2020-02-04
+)
+
+# strptime各字段对应的正则,与datetime.strptime内部生成的一致(含非补零字段)
+_FIELD_PATTERNS = {
+    'Y': r'\d\d\d\d',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'd': r'3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'M': r'[0-5]\d|\d',
+    'S': r'6[0-1]|[0-5]\d|\d',
+    'f': r'[0-9]{1,6}',
+}
+
+
+def _compile_date_formats(formats: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, Tuple]]:
+    """
+    将多个strptime格式编译为一个交替正则(与strptime一样大小写不敏感、空白匹配任意长度空白)
+
+    第i个格式包在命名分组fmt{i}中,其字段分组名为"字段_i"(如Y_0),
+    匹配后由lastgroup即可知道命中的是哪个格式
+
+    Args:
+        formats: 只包含_FIELD_PATTERNS中字段的strptime格式
+
+    Returns:
+        (编译后的正则, {分支名: 按年月日时分秒微秒顺序排列的字段分组名})
+    """
+    branches = []
+    group_names = {}
+    for index, fmt in enumerate(formats):
+        parts = []
+        for token in re.split(r'(%\w|\s+)', fmt):
+            if token.startswith('%'):
+                parts.append(f'(?P<{token[1]}_{index}>{_FIELD_PATTERNS[token[1]]})')
+            elif token.isspace():
+                parts.append(r'\s+')
+            else:
+                parts.append(re.escape(token))
+        branches.append(f"(?P<fmt{index}>{''.join(parts)})")
+        # 所有格式的字段都是"年月日时分秒微秒"的前缀,按此顺序记录分组名即可直接传给datetime
+        group_names[f'fmt{index}'] = tuple(
+            f'{field}_{index}' for field in 'YmdHMSf' if f'%{field}' in fmt
+        )
+    return re.compile('|'.join(branches), re.IGNORECASE), group_names
+
+
+# 所有格式合并成的预编译正则,一次fullmatch即可确定格式,
+# 避免每次调用都走strptime的格式解析与缓存查找
+_CVE_DATE_RE, _CVE_DATE_GROUPS = _compile_date_formats(_CVE_DATE_FORMATS)
+
+# format_time_delta使用的单位表: (上限秒数, 换算除数, 单位),超过最后一个上限时按天显示
+_TIME_DELTA_UNITS = (
+    (60, 1, '秒'),
+    (3600, 60, '分钟'),
+    (86400, 3600, '小时'),
+)
+
+
+def _parse_fixed_width(value: str) -> Optional[datetime]:
+    """
+    按固定位置切片解析最常见的两种CVE时间格式
+
+    覆盖"2020-02-04T17:15Z"(17字符)与"2020-02-04T17:15:30Z"(20字符),
+    只做切片与int()转换,不经过正则引擎
+
+    Args:
+        value: CVE披露时间字符串
+
+    Returns:
+        datetime对象,形状不符或字段越界时返回None(交由通用路径处理)
+    """
+    # strptime的月/时/分等字段只接受ASCII数字,非ASCII输入交由通用路径
+    if not value.isascii():
+        return None
+
+    length = len(value)
+    if length == 17:
+        # 第10/13/16位依次为 T : Z
+        if value[10:17:3] != 'T:Z':
+            return None
+        second = '0'
+    elif length == 20:
+        # 第10/13/16/19位依次为 T : : Z
+        if value[10:20:3] != 'T::Z':
+            return None
+        second = value[17:19]
+        if not second.isdecimal():
+            return None
+    else:
+        return None
+
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    hour, minute = value[11:13], value[14:16]
+    if not (value[4:8:3] == '--' and year.isdecimal() and month.isdecimal()
+            and day.isdecimal() and hour.isdecimal() and minute.isdecimal()):
+        return None
+
+    try:
+        return datetime(int(year), int(month), int(day),
+                        int(hour), int(minute), int(second))
+    except ValueError:
+        return None
+
+
+def _datetime_from_match(match: re.Match) -> datetime:
+    """
+    根据正则匹配结果构造datetime,语义与strptime一致
+
+    Args:
+        match: _CVE_DATE_RE的匹配结果
+
+    Returns:
+        不带时区的datetime对象(字段越界时抛出ValueError)
+    """
+    values = match.group(*_CVE_DATE_GROUPS[match.lastgroup])
+    if len(values) == 7:
+        # 与strptime的%f一致: 不足6位的小数部分右侧补0
+        values = values[:6] + (values[6].ljust(6, '0'),)
+    return datetime(*map(int, values))
+
+
+@lru_cache(maxsize=4096)
+def _parse_cve_published_date(published_date: str) -> datetime:
+    """
+    解析CVE披露时间字符串,结果按字符串缓存(同一批次中披露时间大量重复)
+
+    Args:
+        published_date: CVE披露时间字符串
+
+    Returns:
+        datetime对象(无法解析时抛出异常,异常不会被缓存)
+    """
+    # 绝大多数CVE时间为定长格式,先走切片快速路径
+    parsed = _parse_fixed_width(published_date)
+    if parsed is not None:
+        return parsed
+
+    # 处理多种可能的时间格式(各格式的形状互不重叠,最多只有一个分支能完整匹配)
+    match = _CVE_DATE_RE.fullmatch(published_date)
+    if match is not None:
+        try:
+            return _datetime_from_match(match)
+        except ValueError:
+            pass
+
+    # 如果所有格式都失败,尝试ISO格式解析
+    return _fromisoformat(published_date)
+
+
+@lru_cache(maxsize=4096)
+def _parse_github_commit_date(commit_date: str) -> datetime:
+    """
+    解析GitHub commit时间字符串,结果按字符串缓存
+    (同一仓库的commits会按该仓库下每个CVE的时间窗口重复筛选)
+
+    Args:
+        commit_date: GitHub返回的commit时间字符串
+
+    Returns:
+        datetime对象(无法解析时抛出异常,异常不会被缓存)
+    """
+    # GitHub API返回的时间格式通常是ISO 8601
+    if _parse_iso8601 is not None:
+        try:
+            return _parse_iso8601(commit_date)
+        except ValueError:
+            # ciso8601不接受的写法交给标准库,保持原有的兼容范围和报错信息
+            pass
+    return _fromisoformat(commit_date)
+
+
+def _fromisoformat(value: str) -> datetime:
+    """
+    按ISO 8601解析时间字符串,末尾的Z视为UTC(等价于先替换为+00:00再调用fromisoformat)
+
+    Args:
+        value: 时间字符串
+
+    Returns:
+        datetime对象
+    """
+    # 只有一个Z且位于末尾时直接交给原生解析,省去replace生成新字符串;
+    # 原生不接受的写法(如只有日期的"2020-02-04Z")仍按替换后的结果处理
+    if _FROMISO_HANDLES_Z and value.find('Z') == len(value) - 1:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _format_github_time(dt: datetime) -> str:
+    """
+    格式化为GitHub API要求的"%Y-%m-%dT%H:%M:%SZ"格式
+
+    直接拼接各字段,不经过strftime的格式解析(年份始终补足4位)
+
+    Args:
+        dt: datetime对象(按UTC时间处理,不做时区换算)
+
+    Returns:
+        ISO 8601格式字符串
+    """
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z")
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """
+    在datetime上加减整月,日期超出目标月份天数时取该月最后一天(与relativedelta(months=n)一致)
+
+    Args:
+        dt: datetime对象
+        months: 月数(可为负数)
+
+    Returns:
+        新的datetime对象,时分秒与时区保持不变
+    """
+    year, month = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+    month += 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
+def _to_utc_naive(dt: datetime) -> datetime:
+    """
+    将时间统一换算为不带时区的UTC时间(不带时区的输入按UTC处理),便于转换为numpy datetime64
+
+    Args:
+        dt: datetime对象
+
+    Returns:
+        不带时区的UTC datetime对象
+    """
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# 计算微秒级epoch时间戳用的常量
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_timestamp_us(dt: datetime) -> int:
+    """
+    换算为UTC微秒级epoch时间戳(整数运算,不经过float,不带时区的输入按UTC处理)
+
+    与filter_commits_in_range中datetime64[us]的int64视图取值一致
+
+    Args:
+        dt: datetime对象
+
+    Returns:
+        微秒级时间戳
+    """
+    return (_to_utc_naive(dt) - _EPOCH) // _ONE_MICROSECOND
+
+
+@lru_cache(maxsize=4096)
+def _commit_timestamp_us(commit_date: str) -> int:
+    """
+    解析GitHub commit时间并换算为微秒级时间戳,结果按字符串缓存
+
+    Args:
+        commit_date: GitHub返回的commit时间字符串
+
+    Returns:
+        微秒级时间戳
+    """
+    return _to_timestamp_us(parse_github_commit_date(commit_date))
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """CVE搜索时间窗口,同时保存字符串形式和换算后的时间戳,避免逐个commit重复解析边界"""
+    # 窗口按(披露时间, 前后月数)缓存并在同组CVE间共享,实例只读且字段固定
+    __slots__ = ('since', 'until', 'since_ts', 'until_ts')
     
-    @staticmethod
-    def parse_cve_published_date(published_date: str) -> datetime:
-        """
-        解析CVE披露时间字符串
+    since: str
+    until: str
+    # 边界的UTC微秒级时间戳,与commit时间比较时用整数比较代替datetime比较
+    since_ts: int
+    until_ts: int
+
+
+def parse_cve_published_date(published_date: str) -> datetime:
+    """
+    解析CVE披露时间字符串
+    
+    Args:
+        published_date: CVE披露时间字符串,格式如"2020-02-04T17:15Z"
         
-        Args:
-            published_date: CVE披露时间字符串,格式如"2020-02-04T17:15Z"
-            
-        Returns:
-            datetime对象
-        """
-        try:
-            # 处理多种可能的时间格式
-            formats = [
-                '%Y-%m-%dT%H:%MZ',          # 2020-02-04T17:15Z
-                '%Y-%m-%dT%H:%M:%SZ',       # 2020-02-04T17:15:30Z
-                '%Y-%m-%dT%H:%M:%S.%fZ',    # 2020-02-04T17:15:30.123Z
-                '%Y-%m-%d %H:%M:%S',        # 2020-02-04 17:15:30
-                '%Y-%m-%d',                 # 2020-02-04
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(published_date, fmt)
-                except ValueError:
-                    continue
-            
-            # 如果所有格式都失败,尝试ISO格式解析
-            return datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            
-        except Exception as e:
-            logger.error(f"解析时间失败: {published_date}, 错误: {e}")
-            raise
-    
-    @staticmethod
-    def calculate_time_range(
-        published_date: str,
-        months_before: int = None,
-        months_after: int = None
-    ) -> Tuple[str, str]:
-        """
-        根据CVE披露时间计算搜索时间范围
+    Returns:
+        datetime对象
+    """
+    try:
+        return _parse_cve_published_date(published_date)
+    except Exception as e:
+        logger.error(f"解析时间失败: {published_date}, 错误: {e}")
+        raise
+
+
+@lru_cache(maxsize=4096)
+def _calculate_time_window(
+    published_date: str,
+    months_before: int,
+    months_after: int
+) -> TimeWindow:
+    """
+    计算搜索时间窗口,结果按(披露时间, 前后月数)缓存
+    (披露时间相同的CVE共用同一窗口,同一仓库分组中的CVE也会先后计算两次)
+
+    Args:
+        published_date: CVE披露时间字符串
+        months_before: 披露前几个月
+        months_after: 披露后几个月
+
+    Returns:
+        TimeWindow对象(不可变,可安全共享)
+    """
+    # 解析CVE披露时间
+    publish_time = parse_cve_published_date(published_date)
+    
+    # 计算时间范围
+    since_time = _add_months(publish_time, -months_before)
+    until_time = _add_months(publish_time, months_after)
+    
+    # 转换为ISO 8601格式(GitHub API要求的格式)
+    since_str = _format_github_time(since_time)
+    until_str = _format_github_time(until_time)
+    
+    logger.debug(f"时间范围: {since_str} ~ {until_str} (基于 {published_date})")
+    
+    return TimeWindow(
+        since_str,
+        until_str,
+        _to_timestamp_us(parse_github_commit_date(since_str)),
+        _to_timestamp_us(parse_github_commit_date(until_str))
+    )
+
+
+def calculate_time_window(
+    published_date: str,
+    months_before: int = None,
+    months_after: int = None
+) -> TimeWindow:
+    """
+    根据CVE披露时间计算搜索时间窗口
+    
+    Args:
+        published_date: CVE披露时间字符串
+        months_before: 披露前几个月(默认从配置读取)
+        months_after: 披露后几个月(默认从配置读取)
         
-        Args:
-            published_date: CVE披露时间字符串
-            months_before: 披露前几个月(默认从配置读取)
-            months_after: 披露后几个月(默认从配置读取)
-            
-        Returns:
-            (since, until)元组,都是ISO 8601格式字符串
-        """
-        if months_before is None:
-            months_before = TIME_RANGE_CONFIG['months_before']
-        if months_after is None:
-            months_after = TIME_RANGE_CONFIG['months_after']
+    Returns:
+        TimeWindow对象,since/until为ISO 8601格式字符串,
+        since_ts/until_ts为按相同字符串换算出的UTC微秒级时间戳
+    """
+    if months_before is None:
+        months_before = TIME_RANGE_CONFIG['months_before']
+    if months_after is None:
+        months_after = TIME_RANGE_CONFIG['months_after']
+    
+    return _calculate_time_window(published_date, months_before, months_after)
+
+
+def calculate_time_range(
+    published_date: str,
+    months_before: int = None,
+    months_after: int = None
+) -> Tuple[str, str]:
+    """
+    根据CVE披露时间计算搜索时间范围
+    
+    Args:
+        published_date: CVE披露时间字符串
+        months_before: 披露前几个月(默认从配置读取)
+        months_after: 披露后几个月(默认从配置读取)
         
-        # 解析CVE披露时间
-        publish_time = TimeRangeCalculator.parse_cve_published_date(published_date)
+    Returns:
+        (since, until)元组,都是ISO 8601格式字符串
+    """
+    window = calculate_time_window(
+        published_date, months_before, months_after
+    )
+    return (window.since, window.until)
+
+
+def format_datetime_for_github(dt: datetime) -> str:
+    """
+    将datetime对象格式化为GitHub API要求的格式
+    
+    Args:
+        dt: datetime对象
+        
+    Returns:
+        ISO 8601格式字符串
+    """
+    return _format_github_time(dt)
+
+
+def parse_github_commit_date(commit_date: str) -> datetime:
+    """
+    解析GitHub commit时间字符串
+    
+    Args:
+        commit_date: GitHub返回的commit时间字符串
         
-        # 计算时间范围
-        since_time = publish_time - relativedelta(months=months_before)
-        until_time = publish_time + relativedelta(months=months_after)
+    Returns:
+        datetime对象
+    """
+    try:
+        return _parse_github_commit_date(commit_date)
+    except Exception as e:
+        logger.error(f"解析GitHub commit时间失败: {commit_date}, 错误: {e}")
+        raise
+
+
+def is_commit_in_range(
+    commit_date: str,
+    since: str,
+    until: str
+) -> bool:
+    """
+    检查commit时间是否在指定范围内
+    
+    已弃用: 每次调用都要重新解析since/until,逐个commit检查时请改用
+    calculate_time_window + is_commit_in_window
+    
+    Args:
+        commit_date: commit时间字符串
+        since: 开始时间字符串
+        until: 结束时间字符串
         
-        # 转换为ISO 8601格式(GitHub API要求的格式)
-        since_str = since_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-        until_str = until_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+    Returns:
+        True表示在范围内,False表示不在
+    """
+    try:
+        commit_dt = parse_github_commit_date(commit_date)
+        since_dt = parse_cve_published_date(since)
+        until_dt = parse_cve_published_date(until)
         
-        logger.debug(f"时间范围: {since_str} ~ {until_str} (基于 {published_date})")
+        return since_dt <= commit_dt <= until_dt
+    except Exception as e:
+        logger.error(f"检查commit时间范围失败: {e}")
+        return False
+
+
+def is_commit_in_window(commit_date: str, window: TimeWindow) -> bool:
+    """
+    检查commit时间是否在时间窗口内(边界已预先换算为时间戳,只解析commit时间)
+    
+    Args:
+        commit_date: GitHub返回的commit时间字符串
+        window: calculate_time_window返回的时间窗口
         
-        return (since_str, until_str)
+    Returns:
+        True表示在窗口内,False表示不在
+    """
+    return window.since_ts <= _commit_timestamp_us(commit_date) <= window.until_ts
+
+
+def _commit_datetime64(commit_date: str) -> np.datetime64:
+    """
+    将单个commit时间转换为UTC的datetime64[us]
+
+    Args:
+        commit_date: GitHub返回的commit时间字符串
+
+    Returns:
+        datetime64对象,无法解析时返回NaT(单个坏数据不影响整批筛选)
+    """
+    try:
+        return np.datetime64(_to_utc_naive(_parse_github_commit_date(commit_date)), 'us')
+    except (TypeError, ValueError) as e:
+        logger.debug("无法解析commit时间,视为不在范围内: %r, 错误: %s", commit_date, e)
+        return np.datetime64('NaT', 'us')
+
+
+def parse_commit_timestamps(commit_dates: List[str]) -> np.ndarray:
+    """
+    批量将commit时间转换为UTC微秒级时间戳
     
-    @staticmethod
-    def format_datetime_for_github(dt: datetime) -> str:
-        """
-        将datetime对象格式化为GitHub API要求的格式
+    Args:
+        commit_dates: GitHub返回的commit时间字符串列表
         
-        Args:
-            dt: datetime对象
-            
-        Returns:
-            ISO 8601格式字符串
-        """
-        return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-    
-    @staticmethod
-    def parse_github_commit_date(commit_date: str) -> datetime:
-        """
-        解析GitHub commit时间字符串
+    Returns:
+        与commit_dates等长的int64数组(无法解析的commit时间为NaT对应的int64最小值)
+    """
+    # GitHub返回的时间几乎都是"...Z"结尾的UTC时间,去掉Z后交给numpy直接解析字符串
+    dates = [date[:-1] for date in commit_dates if date[-1:] == 'Z']
+    try:
+        if len(dates) != len(commit_dates):
+            raise ValueError('存在非UTC(Z结尾)的时间')
+        commit_dts = np.array(dates, dtype='datetime64[us]')
+    except ValueError:
+        # 带偏移量等其他写法逐个解析后换算为UTC,无法解析的时间(如缺失时的空字符串)记为NaT
+        commit_dts = np.array(
+            [_commit_datetime64(date) for date in commit_dates],
+            dtype='datetime64[us]'
+        )
+    
+    # datetime64的零拷贝int64视图即微秒级时间戳
+    return commit_dts.view(np.int64)
+
+
+def timestamps_in_window(timestamps: np.ndarray, window: TimeWindow) -> np.ndarray:
+    """
+    批量检查时间戳是否在时间窗口[since, until]内
+    
+    Args:
+        timestamps: parse_commit_timestamps返回的时间戳数组
+        window: calculate_time_window返回的时间窗口
         
-        Args:
-            commit_date: GitHub返回的commit时间字符串
-            
-        Returns:
-            datetime对象
-        """
-        try:
-            # GitHub API返回的时间格式通常是ISO 8601
-            return datetime.fromisoformat(commit_date.replace('Z', '+00:00'))
-        except Exception as e:
-            logger.error(f"解析GitHub commit时间失败: {commit_date}, 错误: {e}")
-            raise
-    
-    @staticmethod
-    def is_commit_in_range(
-        commit_date: str,
-        since: str,
-        until: str
-    ) -> bool:
-        """
-        检查commit时间是否在指定范围内
+    Returns:
+        与timestamps等长的布尔数组,True表示在范围内(NaT对应int64最小值,判为不在范围内)
+    """
+    return (timestamps >= window.since_ts) & (timestamps <= window.until_ts)
+
+
+def filter_commits_in_range(
+    commit_dates: List[str],
+    window: TimeWindow
+) -> np.ndarray:
+    """
+    批量检查commit时间是否在时间窗口[since, until]内
+    
+    commit时间一次性转换为时间戳数组,再与窗口预先算好的时间戳做向量化比较,
+    代替逐个commit的Python比较;同一批commit要与多个窗口比较时,
+    可先调用parse_commit_timestamps再对每个窗口调用timestamps_in_window
+    
+    Args:
+        commit_dates: GitHub返回的commit时间字符串列表
+        window: calculate_time_window返回的时间窗口
         
-        Args:
-            commit_date: commit时间字符串
-            since: 开始时间字符串
-            until: 结束时间字符串
-            
-        Returns:
-            True表示在范围内,False表示不在
-        """
-        try:
-            commit_dt = TimeRangeCalculator.parse_github_commit_date(commit_date)
-            since_dt = TimeRangeCalculator.parse_cve_published_date(since)
-            until_dt = TimeRangeCalculator.parse_cve_published_date(until)
-            
-            return since_dt <= commit_dt <= until_dt
-        except Exception as e:
-            logger.error(f"检查commit时间范围失败: {e}")
-            return False
+    Returns:
+        与commit_dates等长的布尔数组,True表示在范围内(无法解析的commit时间为False)
+    """
+    return timestamps_in_window(parse_commit_timestamps(commit_dates), window)
+
+
+def format_time_delta(seconds: float) -> str:
+    """
+    格式化时间差为可读字符串
     
-    @staticmethod
-    def format_time_delta(seconds: float) -> str:
-        """
-        格式化时间差为可读字符串
+    Args:
+        seconds: 秒数
         
-        Args:
-            seconds: 秒数
-            
-        Returns:
-            格式化的时间字符串
-        """
-        if seconds < 60:
-            return f"{seconds:.1f}秒"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f}分钟"
-        elif seconds < 86400:
-            return f"{seconds/3600:.1f}小时"
-        else:
-            return f"{seconds/86400:.1f}天"
+    Returns:
+        格式化的时间字符串
+    """
+    for threshold, divisor, unit in _TIME_DELTA_UNITS:
+        if seconds < threshold:
+            return f"{seconds / divisor:.1f}{unit}"
+    return f"{seconds / 86400:.1f}天"
+
+
+class TimeRangeCalculator:
+    """时间范围计算类(保留原有接口,各方法转发到同名的模块级函数)"""
+    
+    parse_cve_published_date = staticmethod(parse_cve_published_date)
+    calculate_time_window = staticmethod(calculate_time_window)
+    calculate_time_range = staticmethod(calculate_time_range)
+    format_datetime_for_github = staticmethod(format_datetime_for_github)
+    parse_github_commit_date = staticmethod(parse_github_commit_date)
+    is_commit_in_range = staticmethod(is_commit_in_range)
+    is_commit_in_window = staticmethod(is_commit_in_window)
+    parse_commit_timestamps = staticmethod(parse_commit_timestamps)
+    timestamps_in_window = staticmethod(timestamps_in_window)
+    filter_commits_in_range = staticmethod(filter_commits_in_range)
+    format_time_delta = staticmethod(format_time_delta)
 
 
 if __name__ == "__main__":